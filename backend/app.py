@@ -1,16 +1,78 @@
+import asyncio
+import io
+import os
+from contextlib import asynccontextmanager
 from typing import Dict
 
+import anyio
+import numpy as np
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
+from matplotlib.figure import Figure
 
 from core.logging_config import log_info, setup_logging
+from core.portfolio import get_portfolio
+from core.api.api_utils import prepare_market_data
 from core.api.routes import router as core_router
+from simulation.engine.monte_carlo import simulate_portfolio_paths
 from simulation.api.routes import router as simulation_router
 from optimization.api.routes import router as optimization_router
 
 
-app = FastAPI(title="Quantitative Portfolio API")
+def _warmup() -> None:
+    """Pay one-time costs at boot instead of on the first user request.
+
+    Rendering a throwaway figure builds matplotlib's font cache and
+    initializes Agg; a tiny simulation triggers BLAS initialization; the
+    market-data prefetch fills the price/stats caches for the default
+    portfolio. Network failures here are logged and ignored - warmup must
+    never prevent the server from coming up.
+    """
+    fig = Figure(figsize=(1, 1))
+    fig.subplots().plot([0, 1], [0, 1])
+    fig.savefig(io.BytesIO(), format="png")
+
+    simulate_portfolio_paths(
+        np.zeros(2), np.eye(2) * 1e-4, [0.5, 0.5], num_simulations=2
+    )
+
+    try:
+        tickers, _ = get_portfolio()
+        prepare_market_data(tickers)
+        log_info("Warmup complete", prefetched_tickers=len(tickers))
+    except Exception as exc:
+        log_info("Warmup price prefetch skipped", reason=str(exc))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Size the AnyIO threadpool (used by run_in_threadpool) to the machine
+    # instead of the default 40 tokens, so CPU-bound simulation work doesn't
+    # oversubscribe cores under load. Floor it at 8: the same pool carries
+    # IO-bound work (ticker probes, cold-cache Yahoo downloads) that blocks
+    # for seconds, and on a 1-vCPU container cpu*2 would leave two tokens -
+    # two slow fetches would then stall every other request.
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = max(8, (os.cpu_count() or 1) * 2)
+
+    # Warm caches in the background so the server accepts requests
+    # immediately while the first-request costs are paid off-path.
+    warmup_task = asyncio.create_task(run_in_threadpool(_warmup))
+    yield
+    warmup_task.cancel()
+
+
+# orjson serializes responses several times faster than the stdlib json
+# encoder. Routes with response models already serialize through Pydantic's
+# Rust core; the orjson default covers the plain-dict endpoints.
+app = FastAPI(
+    title="Quantitative Portfolio API",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
 
 setup_logging()
 log_info("Quantitative Portfolio API starting up")
@@ -27,8 +89,25 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that marks responses as long-lived and immutable.
+
+    Chart filenames carry a request-hash suffix, so a given URL always points
+    at the same rendered PNG; browsers can cache it for a year and the SPA's
+    regime toggling stops re-downloading charts it has already seen.
+
+    Conditional requests need no extra handling: the underlying FileResponse
+    already stamps a stat-based ETag and answers If-None-Match with 304.
+    """
+
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
+
 # Static file serving
-app.mount("/charts", StaticFiles(directory="simulation/charts"), name="charts")
+app.mount("/charts", CachedStaticFiles(directory="simulation/charts"), name="charts")
 
 
 app.include_router(core_router)
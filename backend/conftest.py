@@ -0,0 +1,12 @@
+import pytest
+
+from core.api import api_utils
+
+
+@pytest.fixture(autouse=True)
+def clear_market_data_caches():
+    """Clear the per-process market-data caches so mocked fetches in one test
+    can never leak cached results into another."""
+    api_utils._historical_stats.cache_clear()
+    yield
+    api_utils._historical_stats.cache_clear()
@@ -1,12 +1,18 @@
 from typing import Dict, List, Literal, Optional, Union
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 RegimeFactors = Dict[str, Union[Dict[str, Optional[float]], float]]
 
 
 class PortfolioRequestPayload(BaseModel):
-    tickers: List[str]
-    weights: List[float]
+    # Non-empty and size-cap constraints are enforced by pydantic-core in Rust
+    # before any handler runs; the business checks (weight sum, duplicates,
+    # dates) stay in validate_portfolio because the frontend consumes its
+    # structured {"success": false, "errors": [...]} responses rather than
+    # 422s. The cap of 64 assets bounds work for the validate/simulate
+    # pipelines without constraining any realistic portfolio.
+    tickers: List[str] = Field(min_length=1, max_length=64)
+    weights: List[float] = Field(min_length=1, max_length=64)
     regime: Optional[str] = "historical"
     regime_factors: Optional[RegimeFactors] = None
     start_date: Optional[str] = None
@@ -1,6 +1,10 @@
-from fastapi import APIRouter, WebSocket
+import hashlib
+
+import orjson
+from fastapi import APIRouter, Request, Response, WebSocket
+from fastapi.concurrency import run_in_threadpool
 from core.logging_config import log_info
-from core.portfolio import get_portfolio
+from core.portfolio import ASSET_DESCRIPTIONS, get_portfolio
 from core.utils import DEFAULT_PORTFOLIO_DATES
 from core.api.models import (
     LogPayload,
@@ -19,6 +23,55 @@ from core.api.api_utils import (
 
 router = APIRouter(prefix="/api", tags=["core"])
 
+# The default portfolio is constant, so its response payload is built and
+# serialized once at import; the handler returns the bytes as-is. The ETag is
+# derived from those bytes so repeat fetches can be answered with a 304.
+_DEFAULT_PORTFOLIO_RESPONSE = {
+    "portfolio_assets": [
+        {
+            "ticker": ticker,
+            "weight_pct": round(weight * 100, 2),
+            "description": ASSET_DESCRIPTIONS.get(ticker, ""),
+        }
+        for ticker, weight in zip(*get_portfolio())
+    ],
+    "start_date": DEFAULT_PORTFOLIO_DATES["start"],
+    "end_date": DEFAULT_PORTFOLIO_DATES["end"],
+}
+_DEFAULT_PORTFOLIO_BYTES = orjson.dumps(_DEFAULT_PORTFOLIO_RESPONSE)
+_DEFAULT_PORTFOLIO_ETAG = (
+    f'"{hashlib.blake2b(_DEFAULT_PORTFOLIO_BYTES, digest_size=8).hexdigest()}"'
+)
+
+
+def _etag_for(payload_bytes: bytes) -> str:
+    return f'"{hashlib.blake2b(payload_bytes, digest_size=8).hexdigest()}"'
+
+
+# The regimes list and per-regime parameter payloads are just as constant as
+# the default portfolio (they derive from get_portfolio() and the regime
+# dicts), so they get the same treatment: serialize once at import, answer
+# repeat fetches with 304.
+_REGIMES_BYTES = orjson.dumps(get_available_regimes())
+_REGIMES_ETAG = _etag_for(_REGIMES_BYTES)
+
+_REGIME_PARAMETERS_BYTES = {}
+for _key in ("historical", "fiat_debasement", "geopolitical_crisis"):
+    _payload = get_regime_parameters(_key)
+    _payload_bytes = orjson.dumps(_payload)
+    _REGIME_PARAMETERS_BYTES[_payload["regime"]] = (_payload_bytes, _etag_for(_payload_bytes))
+
+
+def _conditional_json(request: Request, payload_bytes: bytes, etag: str) -> Response:
+    """Serve pre-serialized JSON bytes with ETag/304 handling."""
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+    return Response(
+        content=payload_bytes,
+        media_type="application/json",
+        headers={"ETag": etag},
+    )
+
 
 @router.post("/logs")
 async def receive_frontend_logs(log_data: LogPayload):
@@ -43,8 +96,8 @@ async def websocket_live_prices_endpoint(websocket: WebSocket):
     await streamer.start()
 
 
-@router.get("/portfolio/default")
-async def get_default_portfolio() -> PortfolioDefaultResponse:
+@router.get("/portfolio/default", response_model=PortfolioDefaultResponse)
+async def get_default_portfolio(request: Request) -> Response:
     """
     Returns the default portfolio as a list of assets, each with ticker, weight_pct (percentage), and description, and the default date range for visualization.
 
@@ -61,31 +114,9 @@ async def get_default_portfolio() -> PortfolioDefaultResponse:
     }
     ```
     """
-    tickers, weights = get_portfolio()
-
-    descriptions = {
-        "BTC-EUR": "Bitcoin - Main hedge against fiat debasement",
-        "5MVW.DE": "Energy Sector - Global energy infrastructure",
-        "SPYL.DE": "S&P 500 - US large-cap stocks",
-        "WMIN.DE": "Global Miners - Commodity producers",
-        "IS3N.DE": "Emerging Markets - High-growth economies",
-        "4GLD.DE": "Gold - Traditional safe haven",
-    }
-
-    default_portfolio_assets = [
-        {
-            "ticker": ticker,
-            "weight_pct": round(weight * 100, 2),
-            "description": descriptions.get(ticker, ""),
-        }
-        for ticker, weight in zip(tickers, weights)
-    ]
-
-    return {
-        "portfolio_assets": default_portfolio_assets,
-        "start_date": DEFAULT_PORTFOLIO_DATES["start"],
-        "end_date": DEFAULT_PORTFOLIO_DATES["end"],
-    }
+    return _conditional_json(
+        request, _DEFAULT_PORTFOLIO_BYTES, _DEFAULT_PORTFOLIO_ETAG
+    )
 
 
 @router.post("/portfolio/validate")
@@ -103,7 +134,7 @@ async def validate_custom_portfolio(
       - Tickers and weights are same length
       - Weights are numbers, non-negative, and sum to 1.0 (within tolerance)
       - No duplicate tickers
-      - All tickers are fetchable (exist in yfinance) for the given date range
+      - All tickers exist on Yahoo Finance (lightweight quote probe)
 
     Response example (valid):
     ```json
@@ -114,7 +145,9 @@ async def validate_custom_portfolio(
     { "success": false, "errors": ["Weights must sum to 1.0.", "Ticker 'XYZ' is invalid."] }
     ```
     """
-    return validate_portfolio(
+    # Validation can hit Yahoo Finance on a cache miss; keep the event loop free.
+    return await run_in_threadpool(
+        validate_portfolio,
         request.tickers,
         request.weights,
         request.regime_factors,
@@ -123,8 +156,8 @@ async def validate_custom_portfolio(
     )
 
 
-@router.get("/regimes")
-async def get_regimes() -> RegimesResponse:
+@router.get("/regimes", response_model=RegimesResponse)
+async def get_regimes(request: Request) -> Response:
     """
     Returns a list of available regimes, each with key, name, and description.
 
@@ -138,13 +171,14 @@ async def get_regimes() -> RegimesResponse:
     }
     ```
     """
-    return get_available_regimes()
+    return _conditional_json(request, _REGIMES_BYTES, _REGIMES_ETAG)
 
 
-@router.get("/regimes/{regime}/parameters")
+@router.get("/regimes/{regime}/parameters", response_model=RegimeParametersResponse)
 async def get_regime_parameters_endpoint(
     regime: str,
-) -> RegimeParametersResponse:
+    request: Request,
+) -> Response:
     """
     Returns the regime modification parameters for the given regime.
 
@@ -161,4 +195,8 @@ async def get_regime_parameters_endpoint(
     }
     ```
     """
-    return get_regime_parameters(regime)
+    # get_regime_parameters still owns normalization and the 404; the bytes
+    # lookup only serves known regimes, keyed by the payload's display name.
+    payload = get_regime_parameters(regime)
+    payload_bytes, etag = _REGIME_PARAMETERS_BYTES[payload["regime"]]
+    return _conditional_json(request, payload_bytes, etag)
@@ -12,8 +12,9 @@ class JSONFormatter(logging.Formatter):
             "module": record.name,
         }
 
-        if hasattr(record, "extra"):
-            log_data.update(record.extra)
+        extra = getattr(record, "extra", None)
+        if extra:
+            log_data.update(extra)
 
         return json.dumps(log_data)
 
@@ -34,19 +35,19 @@ def setup_logging():
 logger = logging.getLogger("monte_carlo")
 
 
+# Both helpers check isEnabledFor before doing anything, so a filtered-out
+# call costs one integer compare - no LogRecord is built. The kwargs travel
+# through logging's own `extra` mechanism (record.extra), which the formatter
+# and Cloud Logging's handler both read off the record.
+
+
 def log_info(message: str, **extra):
-    if extra:
-        record = logger.makeRecord(logger.name, logging.INFO, "", 0, message, (), None)
-        record.extra = extra
-        logger.handle(record)
-    else:
-        logger.info(message)
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    logger.info(message, extra={"extra": extra} if extra else None)
 
 
 def log_error(message: str, **extra):
-    if extra:
-        record = logger.makeRecord(logger.name, logging.ERROR, "", 0, message, (), None)
-        record.extra = extra
-        logger.handle(record)
-    else:
-        logger.error(message)
+    if not logger.isEnabledFor(logging.ERROR):
+        return
+    logger.error(message, extra={"extra": extra} if extra else None)
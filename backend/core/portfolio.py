@@ -1,6 +1,20 @@
+from functools import lru_cache
 from typing import List, Tuple
 
 
+# Display descriptions for the default portfolio assets, kept next to the
+# portfolio definition so adding an asset touches one module.
+ASSET_DESCRIPTIONS = {
+    "BTC-EUR": "Bitcoin - Main hedge against fiat debasement",
+    "5MVW.DE": "Energy Sector - Global energy infrastructure",
+    "SPYL.DE": "S&P 500 - US large-cap stocks",
+    "WMIN.DE": "Global Miners - Commodity producers",
+    "IS3N.DE": "Emerging Markets - High-growth economies",
+    "4GLD.DE": "Gold - Traditional safe haven",
+}
+
+
+@lru_cache(maxsize=1)
 def get_portfolio() -> Tuple[List[str], List[float]]:
     tickers = ["BTC-EUR", "5MVW.DE", "SPYL.DE", "WMIN.DE", "IS3N.DE", "4GLD.DE"]
     weights = [0.6, 0.13, 0.105, 0.07, 0.06, 0.035]
@@ -1,6 +1,12 @@
+# yfinance routes every request through its YfData singleton - one keep-alive
+# session (with Yahoo's cookie/crumb state) shared across all Ticker/download
+# calls and threads - so connections are already pooled process-wide.
 import yfinance as yf
+import io
 import os
-import matplotlib.pyplot as plt
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 import numpy as np
 from functools import lru_cache
@@ -17,6 +23,11 @@ FIAT_DEBASEMENT_REGIME_NAME = "Fiat Debasement"
 
 DEFAULT_PORTFOLIO_DATES = {"start": "2022-01-01", "end": "2024-12-31"}
 
+# Chart export resolution. 150 dpi is still ~2x the dashboard display size but
+# encodes 4x fewer pixels than the previous 300 dpi, so savefig is much faster
+# and the PNGs shrink accordingly.
+SAVEFIG_DPI = 150
+
 
 class InvalidTickersException(Exception):
     def __init__(self, message: str, invalid_tickers: Optional[List[str]] = None):
@@ -53,7 +64,12 @@ def fetch_close_prices(
     )
 
     # yfinance now defaults auto_adjust=True (adjusted prices). Set explicitly for clarity and to silence FutureWarning.
-    data = yf.download(tickers, start=start, end=end, auto_adjust=True)
+    # threads=True downloads each ticker concurrently, so latency for N tickers
+    # approaches one round trip instead of N; progress=False skips the
+    # stdout progress bar, which is pure overhead on a server.
+    data = yf.download(
+        tickers, start=start, end=end, auto_adjust=True, threads=True, progress=False
+    )
 
     # Reorder MultiIndex columns to match input ticker order
     if isinstance(data.columns, pd.MultiIndex) and data.columns.nlevels == 2:
@@ -106,11 +122,75 @@ def fetch_close_prices(
     return close
 
 
+# Repeat validate -> simulate flows hit memory instead of re-downloading from Yahoo.
+# TTL keeps entries fresh enough for date ranges that include the current day.
+# Overridable via env for deployments that want longer reuse (historical ranges
+# are effectively immutable intraday).
+PRICE_CACHE_TTL_SECONDS = int(os.environ.get("PRICE_CACHE_TTL_SECONDS", "600"))
+
+
 @lru_cache(maxsize=128)
+def _fetch_close_prices_cached(tickers_key: str, start: str, end: str, _ttl_bucket: int):
+    """LRU-cached fetch - tickers_key is a comma-separated, sorted, deduplicated string."""
+    return fetch_close_prices(tickers_key.split(","), start, end)
+
+
 def get_cached_prices(tickers_str: str, start: str, end: str):
-    """Cached wrapper - tickers_str should be comma-separated sorted tickers."""
+    """
+    Cached wrapper around fetch_close_prices - tickers_str should be comma-separated tickers.
+
+    The cache key is order-insensitive (tickers are sorted and deduplicated), so the
+    validate and simulate calls for the same portfolio share one Yahoo download.
+    Columns in the returned DataFrame are reordered to match the requested order.
+    """
     tickers = tickers_str.split(",")
-    return fetch_close_prices(tickers, start, end)
+    tickers_key = ",".join(sorted(set(tickers)))
+    ttl_bucket = int(time.time() // PRICE_CACHE_TTL_SECONDS)
+    close = _fetch_close_prices_cached(tickers_key, start, end, ttl_bucket)
+    return close.reindex(columns=tickers)
+
+
+def verify_tickers_exist(tickers: List[str]) -> None:
+    """
+    Lightweight existence check for tickers using Yahoo's quote metadata.
+
+    Fetches only a few KB of quote metadata per ticker (via yfinance's fast_info,
+    which handles Yahoo's cookie/crumb handshake) instead of downloading years of
+    OHLC history, so validation stays cheap. Successful verifications are cached
+    per TTL bucket, so re-validating the same portfolio skips the probes.
+
+    Raises:
+        InvalidTickersException: If any ticker has no quote data on Yahoo Finance.
+    """
+    ttl_bucket = int(time.time() // PRICE_CACHE_TTL_SECONDS)
+    _verify_tickers_cached(",".join(sorted(set(tickers))), ttl_bucket)
+
+
+@lru_cache(maxsize=512)
+def _verify_tickers_cached(tickers_key: str, _ttl_bucket: int) -> None:
+    """Probe each ticker's quote metadata. lru_cache never stores a call that
+    raised, so only portfolios that verified cleanly are remembered; invalid
+    tickers are re-probed (they may list later)."""
+    tickers = tickers_key.split(",")
+
+    def _is_invalid(ticker: str) -> bool:
+        try:
+            return yf.Ticker(ticker).fast_info["lastPrice"] is None
+        except Exception:
+            return True
+
+    # Each probe is one HTTP round-trip; run them concurrently so validation
+    # latency is roughly one round-trip instead of the sum over all tickers.
+    with ThreadPoolExecutor(max_workers=min(len(tickers), 8)) as executor:
+        results = executor.map(_is_invalid, tickers)
+    invalid_tickers = [t for t, invalid in zip(tickers, results) if invalid]
+
+    if invalid_tickers:
+        log_error("Invalid tickers detected", invalid_tickers=invalid_tickers)
+        raise InvalidTickersException(
+            f"Could not fetch valid price data for tickers: {', '.join(invalid_tickers)}.",
+            invalid_tickers=invalid_tickers,
+        )
 
 
 def transform_to_daily_returns(
@@ -130,10 +210,19 @@ def transform_to_daily_returns(
     if close_prices is None:
         return None
 
-    # Set fill_method=None to avoid FutureWarning and ensure no forward-filling of missing values.
-    daily_returns = close_prices.pct_change(fill_method=None).dropna()
+    # Compute returns on the raw float matrix instead of pct_change: one
+    # vectorized divide with no intermediate shifted DataFrame, then drop any
+    # row containing NaN (no forward-filling of missing values, matching
+    # pct_change(fill_method=None).dropna()).
+    prices = np.ascontiguousarray(close_prices.to_numpy(dtype=np.float64))
+    returns = prices[1:] / prices[:-1] - 1.0
+    valid_rows = ~np.isnan(returns).any(axis=1)
 
-    return daily_returns
+    return pd.DataFrame(
+        returns[valid_rows],
+        index=close_prices.index[1:][valid_rows],
+        columns=close_prices.columns,
+    )
 
 
 def calculate_mean_and_covariance(
@@ -152,14 +241,29 @@ def calculate_mean_and_covariance(
             - cov_matrix (pd.DataFrame): Sample covariance matrix of daily returns between assets.
             - shrunk_cov_matrix (pd.DataFrame): Shrunk covariance matrix with improved numerical stability.
     """
-    mean_returns = daily_returns.mean()
-    cov_matrix = daily_returns.cov()
-    shrunk_cov_matrix = shrink_covariance(daily_returns)
+    if len(daily_returns) < 2:
+        # Degenerate input: fall back to pandas' NaN-aware implementation.
+        mean_returns = daily_returns.mean()
+        cov_matrix = daily_returns.cov()
+    else:
+        # Single pass over the data: center once, then one BLAS GEMM for the
+        # symmetric product instead of np.cov's extra allocations.
+        values = daily_returns.to_numpy(dtype=np.float64)
+        mean = values.mean(axis=0)
+        centered = values - mean
+        cov = centered.T @ centered / (len(values) - 1)
+        mean_returns = pd.Series(mean, index=daily_returns.columns)
+        cov_matrix = pd.DataFrame(
+            cov, index=daily_returns.columns, columns=daily_returns.columns
+        )
+    shrunk_cov_matrix = shrink_covariance(daily_returns, sample_cov=cov_matrix)
     return mean_returns, cov_matrix, shrunk_cov_matrix
 
 
 def shrink_covariance(
-    daily_returns: pd.DataFrame, shrinkage_intensity: float = None
+    daily_returns: pd.DataFrame,
+    shrinkage_intensity: float = None,
+    sample_cov: Optional[pd.DataFrame] = None,
 ) -> pd.DataFrame:
     """
     Apply simple shrinkage to covariance matrix for improved numerical stability.
@@ -171,6 +275,8 @@ def shrink_covariance(
     Parameters:
         daily_returns: DataFrame of daily returns for each asset
         shrinkage_intensity: Shrinkage intensity [0,1]. If None, auto-estimated.
+        sample_cov: Precomputed sample covariance matrix; pass it when the
+            caller already has one so the covariance isn't computed twice.
 
     Returns:
         Shrunk covariance matrix with improved numerical properties
@@ -179,22 +285,24 @@ def shrink_covariance(
         return daily_returns.cov()
 
     # Sample covariance matrix
-    sample_cov = daily_returns.cov()
+    if sample_cov is None:
+        sample_cov = daily_returns.cov()
     n_assets = len(sample_cov)
     n_obs = len(daily_returns)
 
-    # Target: identity matrix scaled by average variance
+    # Shrinkage target: identity scaled by average variance. The target only
+    # touches the diagonal, so it is applied there directly instead of
+    # materializing an n x n eye matrix and a full matrix multiply-add.
     avg_variance = np.trace(sample_cov) / n_assets
-    target = avg_variance * np.eye(n_assets)
 
     # Auto-estimate shrinkage intensity
     if shrinkage_intensity is None:
         shrinkage_intensity = min(0.3, max(0.1, n_assets / n_obs))
 
     # Apply shrinkage: λ * target + (1-λ) * sample
-    shrunk_matrix = (
-        shrinkage_intensity * target + (1 - shrinkage_intensity) * sample_cov.values
-    )
+    shrunk_matrix = (1 - shrinkage_intensity) * sample_cov.values
+    diagonal = np.arange(n_assets)
+    shrunk_matrix[diagonal, diagonal] += shrinkage_intensity * avg_variance
 
     return pd.DataFrame(
         shrunk_matrix, index=sample_cov.index, columns=sample_cov.columns
@@ -248,28 +356,66 @@ def fetch_risk_free_rate() -> float:
         return FALLBACK_RATE
 
 
-def save_figure(regime_name: str, prefix: str) -> str:
+def chart_filename(
+    regime_name: str, prefix: str, cache_key: Optional[str] = None
+) -> Tuple[str, str]:
     """
-    Save the current matplotlib figure to the scenario-specific charts folder.
+    Build the (scenario folder, filename) pair for a chart artifact.
+
+    When a cache_key is given it is appended to the filename, making chart
+    names deterministic per request so identical requests can reuse files.
+    """
+    scenario = str(regime_name).replace(" ", "_").lower()
+    suffix = f"_{cache_key}" if cache_key else ""
+    return scenario, f"{prefix}_{scenario}{suffix}.png"
+
+
+def save_figure(
+    fig, regime_name: str, prefix: str, cache_key: Optional[str] = None
+) -> str:
+    """
+    Save a matplotlib Figure to the scenario-specific charts folder.
 
     The function normalizes the scenario name, creates the folder if it doesn't exist,
-    and saves the current matplotlib figure with a consistent naming scheme:
-    charts/{scenario}/{prefix}_{scenario}.{ext}
+    and saves the given figure with a consistent naming scheme:
+    charts/{scenario}/{prefix}_{scenario}[_{cache_key}].{ext}
 
     Args:
+        fig (matplotlib.figure.Figure): The figure to render. Passing the figure
+            explicitly (instead of relying on pyplot's current-figure global)
+            keeps rendering safe when charts are drawn on worker threads.
         regime_name (str): Scenario name (e.g., 'historical', 'fiat_debasement', ...)
         prefix (str): File prefix (e.g., 'monte_carlo_simulation', 'correlation_matrix')
-        ext (str): File extension (e.g., 'png', 'csv')
+        cache_key (str, optional): Request hash appended to the filename for reuse.
 
     Returns:
         str: URL-style path to the saved figure.
     """
-    scenario = str(regime_name).replace(" ", "_").lower()
+    scenario, filename = chart_filename(regime_name, prefix, cache_key)
     folder = f"simulation/charts/{scenario}"
     os.makedirs(folder, exist_ok=True)
-    filename = f"{prefix}_{scenario}.png"
     full_path = os.path.join(folder, filename)
-    plt.savefig(full_path, dpi=300, bbox_inches="tight")
+
+    # Render to memory, then publish the PNG with one write + atomic rename.
+    # Readers (the static mount) never see a half-written file, and concurrent
+    # renders of the same chart can't corrupt each other.
+    buffer = io.BytesIO()
+    # metadata={} skips the default tEXt chunks (software/creation date), and
+    # compress_level=3 trades ~10% file size for roughly a third of the zlib
+    # CPU that the default level 6 spends per PNG.
+    fig.savefig(
+        buffer,
+        format="png",
+        dpi=SAVEFIG_DPI,
+        bbox_inches="tight",
+        metadata={},
+        pil_kwargs={"compress_level": 3},
+    )
+    tmp_path = f"{full_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(buffer.getbuffer())
+    os.replace(tmp_path, full_path)
+
     # Return URL path fr FastAPI static mount (strip simulation/ prefix)
     url_path = f"/charts/{scenario}/{filename}"
     return url_path
@@ -1,22 +1,133 @@
-from typing import List, Optional
+from typing import Callable, List, Optional, Set
+import asyncio
+
+import numpy as np
+import orjson
+
 from simulation.engine.monte_carlo import modify_portfolio_for_regime
 from optimization.engine.markowitz import (
     calculate_efficient_frontier,
     maximize_sharpe_portfolio,
 )
-from fastapi import HTTPException
+from fastapi import HTTPException, WebSocket
 from core.logging_config import log_error, log_info
-from optimization.api.models import PortfolioOptimizationResponse
 from core.api.api_utils import RegimeFactors, prepare_market_data, resolve_regime
 
 
+class ProgressBroadcaster:
+    """
+    Manages WebSocket connections for efficient-frontier progress updates.
+
+    - Clients connect via /api/optimize/ws/progress and receive progress
+      events as JSON: {"current": ..., "total": ..., "message": ..., "percentage": ...}
+    - Rapid solver ticks are coalesced: only the newest event within the
+      flush window is sent, so fast solves don't emit one frame per point.
+    - Broadcasts fan out to all clients concurrently via asyncio.gather, so
+      one slow client never serializes delivery to the others.
+    - Connections whose send fails are dropped from the pool.
+    """
+
+    # Latest-wins coalescing window. Frontier points can solve in a few
+    # milliseconds each; a progress bar only needs ~20 updates per second,
+    # and the final event is always delivered since it is the latest.
+    FLUSH_INTERVAL_SECONDS = 0.05
+
+    def __init__(self):
+        # A set keeps membership checks and removal O(1); broadcast order
+        # doesn't matter since gather drives all sends concurrently anyway.
+        self.connections: Set[WebSocket] = set()
+        self._latest: Optional[dict] = None
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def connect(self, websocket: WebSocket):
+        await websocket.accept()
+        self.connections.add(websocket)
+        log_info("Progress client connected", num_connections=len(self.connections))
+
+    def disconnect(self, websocket: WebSocket):
+        self.connections.discard(websocket)
+
+    def record_progress(self, progress_data: dict) -> None:
+        """Record the newest event; the pending flush task sends it after the
+        coalescing window, replacing anything older that never got sent.
+
+        Plain function rather than a coroutine so worker threads can schedule
+        it with loop.call_soon_threadsafe - one queued callback per tick, with
+        no coroutine or Future allocation.
+        """
+        self._latest = progress_data
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_latest())
+
+    async def broadcast_progress(self, progress_data: dict):
+        self.record_progress(progress_data)
+
+    async def _flush_latest(self):
+        # Drain in a loop: ticks recorded while the gather below is awaiting
+        # see a not-yet-done task and schedule nothing, so the task must
+        # re-check _latest before exiting or the final event of a solve would
+        # be stranded and the progress bar would stick below 100%.
+        while True:
+            await asyncio.sleep(self.FLUSH_INTERVAL_SECONDS)
+            progress_data, self._latest = self._latest, None
+            if progress_data is None:
+                return
+            if not self.connections:
+                continue
+
+            # Serialize once with orjson and snapshot the pool; gather drives
+            # every socket write in one scheduler pass instead of awaiting
+            # clients in sequence. Frames stay text (like the live-price
+            # stream) so frontend JSON parsing works unchanged; the one
+            # decode is shared by all clients.
+            payload = orjson.dumps(progress_data).decode()
+            connections = list(self.connections)
+            results = await asyncio.gather(
+                *(connection.send_text(payload) for connection in connections),
+                return_exceptions=True,
+            )
+
+            for connection, result in zip(connections, results):
+                if isinstance(result, Exception):
+                    self.disconnect(connection)
+
+
+progress_broadcaster = ProgressBroadcaster()
+
+
+def create_progress_callback(
+    loop: asyncio.AbstractEventLoop,
+) -> Callable[[int, int, str], None]:
+    """
+    Bridge the optimizer's worker thread to the event loop.
+
+    The optimization runs in a threadpool, so the returned callback hands
+    each event to the given loop with call_soon_threadsafe instead of
+    touching the WebSocket pool from the worker thread. record_progress is a
+    plain function, so each tick costs one queued callback - no coroutine or
+    Future object per frontier point.
+    """
+
+    def progress_callback(current: int, total: int, message: str) -> None:
+        progress_data = {
+            "current": current,
+            "total": total,
+            "message": message,
+            "percentage": round(current / total * 100, 1),
+        }
+        loop.call_soon_threadsafe(progress_broadcaster.record_progress, progress_data)
+
+    return progress_callback
+
+
 def optimize_portfolio_api(
     tickers: List[str],
     regime: str,
     regime_factors: Optional[RegimeFactors] = None,
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
-) -> PortfolioOptimizationResponse:
+    progress_callback: Optional[Callable[[int, int, str], None]] = None,
+) -> dict:
     """
     Calculate optimal portfolios using modern portfolio theory for a given regime scenario.
 
@@ -34,10 +145,14 @@ def optimize_portfolio_api(
         regime_factors (RegimeFactors, optional): Custom factors for mean/volatility adjustments and correlations.
         start_date (str, optional): Start date for price data in YYYY-MM-DD format.
         end_date (str, optional): End date for price data in YYYY-MM-DD format.
+        progress_callback (callable, optional): Forwarded to the frontier solver;
+            called with (current, total, message) after each point.
 
     Returns:
-        PortfolioOptimizationResponse: Contains efficient frontier points, maximum Sharpe portfolio,
-                                     and risk-free rate used in calculations.
+        dict: Matches the PortfolioOptimizationResponse schema - efficient frontier
+            points, maximum Sharpe portfolio, and risk-free rate used in calculations.
+            Returned as a plain dict so routes can serialize it directly with
+            ORJSONResponse instead of paying per-float Pydantic validation.
 
     Raises:
         HTTPException: If regime is invalid, tickers are invalid, or optimization fails.
@@ -65,7 +180,9 @@ def optimize_portfolio_api(
 
     # Calculate efficient frontier and max Sharpe portfolio
     try:
-        efficient_frontier = calculate_efficient_frontier(mean_returns, cov_matrix)
+        efficient_frontier = calculate_efficient_frontier(
+            mean_returns, cov_matrix, progress_callback=progress_callback
+        )
         max_sharpe_portfolio = maximize_sharpe_portfolio(mean_returns, cov_matrix)
     except Exception as e:
         msg = f"Optimization failed: {str(e)}. Try with different assets or date range."
@@ -82,24 +199,43 @@ def optimize_portfolio_api(
         max_sharpe_ratio=max_sharpe_portfolio["sharpe_ratio"],
     )
 
-    return PortfolioOptimizationResponse(
-        frontier_points=[
+    # Round all frontier returns/volatilities/weights in three vectorized
+    # calls instead of per-scalar Python round() over every point's weight
+    # vector; the ticker list is shared by every point.
+    tickers_list = list(cov_matrix.columns)
+    returns_pct = np.round(
+        np.fromiter((p["return"] for p in efficient_frontier), dtype=np.float64) * 100,
+        1,
+    )
+    volatilities_pct = np.round(
+        np.fromiter((p["volatility"] for p in efficient_frontier), dtype=np.float64)
+        * 100,
+        1,
+    )
+    weights_pct = np.round(
+        np.vstack([p["weights"] for p in efficient_frontier]) * 100, 1
+    )
+
+    return {
+        "frontier_points": [
             {
-                "return_pct": round(point["return"] * 100, 1),
-                "volatility_pct": round(point["volatility"] * 100, 1),
-                "weights_pct": [round(w * 100, 1) for w in point["weights"].tolist()],
-                "tickers": cov_matrix.columns,
+                "return_pct": point_return,
+                "volatility_pct": point_volatility,
+                "weights_pct": point_weights,
+                "tickers": tickers_list,
             }
-            for point in efficient_frontier
+            for point_return, point_volatility, point_weights in zip(
+                returns_pct.tolist(), volatilities_pct.tolist(), weights_pct.tolist()
+            )
         ],
-        max_sharpe_point={
+        "max_sharpe_point": {
             "sharpe_ratio": round(max_sharpe_portfolio["sharpe_ratio"], 2),
             "return_pct": round(max_sharpe_portfolio["return"] * 100, 1),
             "volatility_pct": round(max_sharpe_portfolio["volatility"] * 100, 1),
-            "weights_pct": [
-                round(w * 100, 1) for w in max_sharpe_portfolio["weights"].tolist()
-            ],
-            "tickers": cov_matrix.columns,
+            "weights_pct": np.round(
+                max_sharpe_portfolio["weights"] * 100, 1
+            ).tolist(),
+            "tickers": tickers_list,
         },
-        risk_free_rate_pct=round(max_sharpe_portfolio["risk_free_rate"] * 100, 1),
-    )
+        "risk_free_rate_pct": round(max_sharpe_portfolio["risk_free_rate"] * 100, 1),
+    }
@@ -1,11 +1,15 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 
 from optimization.api.models import (
     OptimizationRequestPayload,
     PortfolioOptimizationResponse,
 )
 from optimization.api.api_utils import (
+    create_progress_callback,
     optimize_portfolio_api,
+    progress_broadcaster,
 )
 
 from core.portfolio import get_portfolio
@@ -15,10 +19,25 @@ import asyncio
 router = APIRouter(prefix="/api/optimize", tags=["optimization"])
 
 
-@router.post("/custom")
+@router.websocket("/ws/progress")
+async def websocket_progress_endpoint(websocket: WebSocket):
+    """
+    Stream efficient-frontier calculation progress to the frontend.
+
+    Receives: {"current": 15, "total": 25, "message": "...", "percentage": 60.0}
+    """
+    await progress_broadcaster.connect(websocket)
+    try:
+        while True:
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        progress_broadcaster.disconnect(websocket)
+
+
+@router.post("/custom", response_model=PortfolioOptimizationResponse)
 async def optimize_custom_portfolio_regime(
     request: OptimizationRequestPayload,
-) -> PortfolioOptimizationResponse:
+) -> ORJSONResponse:
     """
     Run portfolio optimization for a custom portfolio under a specified regime.
 
@@ -39,19 +58,26 @@ async def optimize_custom_portfolio_regime(
     """
     regime = "custom"
 
-    return optimize_portfolio_api(
+    # CVXPY solves are CPU-bound; run them on a worker thread and bridge
+    # progress back to this loop for the WebSocket broadcast. The result is a
+    # plain dict serialized straight to orjson; response_model documents the
+    # schema without re-validating 25 frontier points' worth of floats.
+    result = await run_in_threadpool(
+        optimize_portfolio_api,
         request.tickers,
         regime,
         request.regime_factors,
         request.start_date,
         request.end_date,
+        progress_callback=create_progress_callback(asyncio.get_running_loop()),
     )
+    return ORJSONResponse(result)
 
 
-@router.post("/{regime}")
+@router.post("/{regime}", response_model=PortfolioOptimizationResponse)
 async def optimize_default_portfolio_regime(
     regime: str,
-) -> PortfolioOptimizationResponse:
+) -> ORJSONResponse:
     """
     Run portfolio optimization for the default portfolio under a specified regime.
 
@@ -68,7 +94,10 @@ async def optimize_default_portfolio_regime(
     """
     tickers, _ = get_portfolio()
 
-    return optimize_portfolio_api(
-        tickers=tickers,
-        regime=regime,
+    result = await run_in_threadpool(
+        optimize_portfolio_api,
+        tickers,
+        regime,
+        progress_callback=create_progress_callback(asyncio.get_running_loop()),
     )
+    return ORJSONResponse(result)
@@ -1,3 +1,9 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
 from optimization.engine.markowitz import (
     calculate_efficient_frontier,
     maximize_sharpe_portfolio,
@@ -14,38 +20,71 @@ from core.utils import (
 )
 from simulation.engine.monte_carlo import modify_portfolio_for_regime
 
-tickers, _ = get_portfolio()
 
-close_values = fetch_close_prices(tickers)
-daily_returns = transform_to_daily_returns(close_values)
+def run_regime(
+    inputs: Tuple[pd.Series, pd.DataFrame],
+) -> Tuple[
+    List[Dict[str, Union[float, np.ndarray]]],
+    Optional[Dict[str, Union[float, np.ndarray]]],
+]:
+    """Solve one regime's frontier sweep and max Sharpe portfolio.
 
-# Historical regime: Baseline scenario using actual past returns and risk.
+    Top-level so it pickles for the process pool; takes a single
+    (mean_returns, cov_matrix) tuple so it works with executor.map.
+    """
+    mean_returns, cov_matrix = inputs
+    frontier = calculate_efficient_frontier(mean_returns, cov_matrix)
+    max_sharpe = maximize_sharpe_portfolio(mean_returns, cov_matrix)
+    return frontier, max_sharpe
 
-historical_mean_returns, _, historical_shrunk_cov = calculate_mean_and_covariance(
-    daily_returns
-)
 
-historical_frontier = calculate_efficient_frontier(
-    historical_mean_returns, historical_shrunk_cov
-)
-historical_max_sharpe = maximize_sharpe_portfolio(
-    historical_mean_returns, historical_shrunk_cov
-)
+def main():
+    tickers, _ = get_portfolio()
 
-# Fiat debasement regime: Simulates strong inflation, BTC and gold outperform, risk-on environment.
+    close_values = fetch_close_prices(tickers)
+    daily_returns = transform_to_daily_returns(close_values)
 
-fiat_mean_returns, fiat_cov_matrix = modify_portfolio_for_regime(
-    historical_mean_returns, historical_shrunk_cov, FIAT_DEBASEMENT_REGIME
-)
+    # Historical regime: Baseline scenario using actual past returns and risk.
 
-fiat_frontier = calculate_efficient_frontier(fiat_mean_returns, fiat_cov_matrix)
-fiat_max_sharpe = maximize_sharpe_portfolio(fiat_mean_returns, fiat_cov_matrix)
+    historical_mean_returns, _, historical_shrunk_cov = calculate_mean_and_covariance(
+        daily_returns
+    )
 
-# Geopolitical crisis regime: Simulates global conflict, equities/EM down, gold/energy up, higher volatility.
+    # Fiat debasement regime: Simulates strong inflation, BTC and gold outperform, risk-on environment.
+
+    fiat_mean_returns, fiat_cov_matrix = modify_portfolio_for_regime(
+        historical_mean_returns, historical_shrunk_cov, FIAT_DEBASEMENT_REGIME
+    )
+
+    # Geopolitical crisis regime: Simulates global conflict, equities/EM down, gold/energy up, higher volatility.
+
+    geo_mean_returns, geo_cov_matrix = modify_portfolio_for_regime(
+        historical_mean_returns, historical_shrunk_cov, GEOPOLITICAL_CRISIS_REGIME
+    )
+
+    # The three regime sweeps are independent CPU-bound solves, so run them on
+    # separate processes; wall clock is bounded by the slowest regime instead
+    # of the sum of all three.
+    regime_inputs = [
+        (historical_mean_returns, historical_shrunk_cov),
+        (fiat_mean_returns, fiat_cov_matrix),
+        (geo_mean_returns, geo_cov_matrix),
+    ]
+    with ProcessPoolExecutor(max_workers=3) as executor:
+        results = list(executor.map(run_regime, regime_inputs))
+
+    (
+        (historical_frontier, historical_max_sharpe),
+        (fiat_frontier, fiat_max_sharpe),
+        (geo_frontier, geo_max_sharpe),
+    ) = results
+
+    return {
+        "historical": (historical_frontier, historical_max_sharpe),
+        "fiat_debasement": (fiat_frontier, fiat_max_sharpe),
+        "geopolitical_crisis": (geo_frontier, geo_max_sharpe),
+    }
 
-geo_mean_returns, geo_cov_matrix = modify_portfolio_for_regime(
-    historical_mean_returns, historical_shrunk_cov, GEOPOLITICAL_CRISIS_REGIME
-)
 
-geo_frontier = calculate_efficient_frontier(geo_mean_returns, geo_cov_matrix)
-geo_max_sharpe = maximize_sharpe_portfolio(geo_mean_returns, geo_cov_matrix)
+if __name__ == "__main__":
+    main()
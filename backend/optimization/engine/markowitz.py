@@ -46,6 +46,7 @@ def calculate_efficient_frontier(
     mean_returns: pd.Series,
     cov_matrix: pd.DataFrame,
     num_points: int = 25,
+    progress_callback: Optional[Callable[[int, int, str], None]] = None,
 ) -> List[Dict[str, Union[float, np.ndarray]]]:
     """
     Calculate efficient frontier with multiple optimal portfolios across risk-return spectrum.
@@ -57,6 +58,9 @@ def calculate_efficient_frontier(
         mean_returns (pd.Series): Mean daily returns for each asset
         cov_matrix (pd.DataFrame): Daily covariance matrix between assets
         num_points (int): Number of portfolios along efficient frontier (default: 25)
+        progress_callback (callable, optional): Called after each frontier point
+            with (current, total, message) so callers can surface progress
+            (e.g., over the /api/optimize/ws/progress WebSocket).
 
     Returns:
         List[Dict]: List of portfolio dictionaries, each containing:
@@ -84,7 +88,7 @@ def calculate_efficient_frontier(
         return_range=f"{min_return:.4f} to {max_return:.4f}",
     )
 
-    for target_return in target_returns:
+    for point_number, target_return in enumerate(target_returns, start=1):
 
         constraints = [
             cp.sum(weights) == 1,  # Budget constraint: must invest 100% of capital
@@ -97,6 +101,13 @@ def calculate_efficient_frontier(
         problem = cp.Problem(objective, constraints)
         problem.solve(solver=cp.OSQP, max_iter=5000, time_limit=10)
 
+        if progress_callback is not None:
+            progress_callback(
+                point_number,
+                num_points,
+                f"Optimizing frontier point {point_number}/{num_points}",
+            )
+
         if problem.status not in ["optimal", "optimal_inaccurate"]:
             failed_points += 1
             continue
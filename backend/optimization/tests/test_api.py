@@ -7,9 +7,12 @@ from fastapi.testclient import TestClient
 import json
 import asyncio
 
+import orjson
+
 from core.utils import InvalidTickersException
 from optimization.api.api_utils import optimize_portfolio_api
 from core.api.api_utils import LivePriceStreamer
+from optimization.api.api_utils import ProgressBroadcaster
 from app import app
 
 
@@ -65,18 +68,18 @@ class TestOptimizePortfolioApi:
         resp = optimize_portfolio_api(tickers, regime)
 
         # Assert numeric formatting to percent fields
-        assert resp.frontier_points[0].return_pct == 8.0
-        assert resp.frontier_points[0].volatility_pct == 12.0
-        assert resp.frontier_points[0].weights_pct == [60.0, 40.0]
-
-        assert resp.max_sharpe_point.return_pct == 9.0
-        assert resp.max_sharpe_point.volatility_pct == 13.0
-        assert resp.max_sharpe_point.weights_pct == [55.0, 45.0]
-        assert resp.max_sharpe_point.sharpe_ratio == pytest.approx(
+        assert resp["frontier_points"][0]["return_pct"] == 8.0
+        assert resp["frontier_points"][0]["volatility_pct"] == 12.0
+        assert resp["frontier_points"][0]["weights_pct"] == [60.0, 40.0]
+
+        assert resp["max_sharpe_point"]["return_pct"] == 9.0
+        assert resp["max_sharpe_point"]["volatility_pct"] == 13.0
+        assert resp["max_sharpe_point"]["weights_pct"] == [55.0, 45.0]
+        assert resp["max_sharpe_point"]["sharpe_ratio"] == pytest.approx(
             0.69, rel=0, abs=0.01
         )
 
-        assert resp.risk_free_rate_pct == 2.5
+        assert resp["risk_free_rate_pct"] == 2.5
 
         mock_fetch.assert_called_once()
         mock_frontier.assert_called_once()
@@ -145,8 +148,8 @@ class TestOptimizePortfolioApi:
         resp = optimize_portfolio_api(tickers, regime, custom_factors)
 
         mock_modify.assert_called_once()
-        assert "frontier_points" in resp.model_dump()
-        assert resp.max_sharpe_point.sharpe_ratio == pytest.approx(0.71, abs=1e-9)
+        assert "frontier_points" in resp
+        assert resp["max_sharpe_point"]["sharpe_ratio"] == pytest.approx(0.71, abs=1e-9)
 
     @patch("core.api.api_utils.get_cached_prices")
     def test_data_fetch_exception_handling(self, mock_fetch):
@@ -338,8 +341,11 @@ class TestLivePriceStreamer:
         # Give the async task a moment to complete
         await asyncio.sleep(0.1)
 
-        # Verify the message was sent to the frontend WebSocket
-        self.mock_websocket.send_text.assert_called_once_with(json.dumps(test_message))
+        # Verify the message was sent to the frontend WebSocket - quotes are
+        # flushed as a batched JSON array after the coalescing window
+        self.mock_websocket.send_text.assert_called_once_with(
+            orjson.dumps([test_message]).decode()
+        )
 
     @pytest.mark.asyncio
     async def test_update_subscription_cancels_old_task(self):
@@ -394,3 +400,82 @@ class TestLivePriceStreamer:
 
         # WebSocket should still be accepted
         self.mock_websocket.accept.assert_called_once()
+
+
+class TestProgressBroadcaster:
+    """Tests for WebSocket progress broadcasting during optimization."""
+
+    def setup_method(self):
+        self.broadcaster = ProgressBroadcaster()
+
+    @pytest.mark.asyncio
+    async def test_connect_accepts_and_tracks_websocket(self):
+        websocket = AsyncMock()
+
+        await self.broadcaster.connect(websocket)
+
+        websocket.accept.assert_called_once()
+        assert websocket in self.broadcaster.connections
+
+    @pytest.mark.asyncio
+    async def test_broadcast_sends_to_all_connections(self):
+        first, second = AsyncMock(), AsyncMock()
+        self.broadcaster.connections = {first, second}
+        progress_data = {"current": 5, "total": 25, "message": "x", "percentage": 20.0}
+
+        await self.broadcaster.broadcast_progress(progress_data)
+        await asyncio.sleep(self.broadcaster.FLUSH_INTERVAL_SECONDS + 0.01)
+
+        expected = orjson.dumps(progress_data).decode()
+        first.send_text.assert_called_once_with(expected)
+        second.send_text.assert_called_once_with(expected)
+
+    @pytest.mark.asyncio
+    async def test_rapid_broadcasts_coalesce_to_latest(self):
+        websocket = AsyncMock()
+        self.broadcaster.connections = {websocket}
+
+        for current in range(1, 6):
+            await self.broadcaster.broadcast_progress(
+                {"current": current, "total": 25}
+            )
+        await asyncio.sleep(self.broadcaster.FLUSH_INTERVAL_SECONDS + 0.01)
+
+        # Only the newest event within the flush window goes out
+        websocket.send_text.assert_called_once_with(
+            orjson.dumps({"current": 5, "total": 25}).decode()
+        )
+
+    @pytest.mark.asyncio
+    async def test_event_recorded_during_send_is_still_flushed(self):
+        websocket = AsyncMock()
+
+        async def slow_send(payload):
+            await asyncio.sleep(self.broadcaster.FLUSH_INTERVAL_SECONDS * 2)
+
+        websocket.send_text.side_effect = slow_send
+        self.broadcaster.connections = {websocket}
+
+        await self.broadcaster.broadcast_progress({"current": 24, "total": 25})
+        # Let the flush task start its (slow) send, then record the final
+        # event while that send is still in flight.
+        await asyncio.sleep(self.broadcaster.FLUSH_INTERVAL_SECONDS + 0.01)
+        await self.broadcaster.broadcast_progress({"current": 25, "total": 25})
+        await asyncio.sleep(self.broadcaster.FLUSH_INTERVAL_SECONDS * 5)
+
+        # The drain loop must deliver the final event instead of stranding it
+        assert websocket.send_text.call_args_list[-1].args[0] == orjson.dumps(
+            {"current": 25, "total": 25}
+        ).decode()
+
+    @pytest.mark.asyncio
+    async def test_broadcast_drops_dead_connections(self):
+        healthy, dead = AsyncMock(), AsyncMock()
+        dead.send_text.side_effect = RuntimeError("connection closed")
+        self.broadcaster.connections = {healthy, dead}
+
+        await self.broadcaster.broadcast_progress({"current": 1, "total": 25})
+        await asyncio.sleep(self.broadcaster.FLUSH_INTERVAL_SECONDS + 0.01)
+
+        assert healthy in self.broadcaster.connections
+        assert dead not in self.broadcaster.connections
@@ -1,3 +1,7 @@
+import hashlib
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 from simulation.engine.monte_carlo import (
     simulate_portfolio_paths,
@@ -9,9 +13,32 @@ from simulation.engine.visualization import (
     plot_simulation_results,
 )
 from core.logging_config import log_info
+from core.utils import PRICE_CACHE_TTL_SECONDS, chart_filename
 from simulation.api.models import SimulationChartsResponse
 from core.api.api_utils import RegimeFactors, prepare_market_data, resolve_regime
 
+CHART_PREFIXES = {
+    "simulation_chart_path": "monte_carlo_simulation",
+    "correlation_matrix_chart_path": "correlation_matrix",
+    "risk_factors_chart_path": "risk_factor_analysis",
+}
+
+
+def _find_cached_charts(
+    regime_name: str, cache_key: str
+) -> Optional[SimulationChartsResponse]:
+    """
+    Return chart URL paths for a request hash if all three PNGs already exist
+    on disk, or None if any are missing and the charts must be rendered.
+    """
+    response = {}
+    for response_field, prefix in CHART_PREFIXES.items():
+        scenario, filename = chart_filename(regime_name, prefix, cache_key)
+        if not os.path.exists(f"simulation/charts/{scenario}/{filename}"):
+            return None
+        response[response_field] = f"/charts/{scenario}/{filename}"
+    return response
+
 
 def run_portfolio_simulation_api(
     tickers: List[str],
@@ -51,6 +78,31 @@ def run_portfolio_simulation_api(
 
     regime_key, regime_name, regime_dict = resolve_regime(regime, regime_factors)
 
+    # Identical requests produce identical charts, so hash the request and
+    # skip the whole simulate + render pipeline when the PNGs already exist.
+    # The price-cache TTL bucket is part of the hash so that open-ended date
+    # ranges re-render once the underlying price data can have refreshed,
+    # instead of serving the first-ever charts forever.
+    ttl_bucket = int(time.time() // PRICE_CACHE_TTL_SECONDS)
+    cache_key = hashlib.sha256(
+        repr(
+            (
+                tuple(tickers),
+                tuple(weights),
+                regime_key,
+                regime_dict,
+                start_date,
+                end_date,
+                ttl_bucket,
+            )
+        ).encode()
+    ).hexdigest()[:16]
+
+    cached_response = _find_cached_charts(regime_name, cache_key)
+    if cached_response is not None:
+        log_info("Serving cached charts", regime=regime_name, cache_key=cache_key)
+        return cached_response
+
     _, historical_mean_returns, historical_cov_matrix, _ = prepare_market_data(
         tickers, start_date, end_date
     )
@@ -64,9 +116,22 @@ def run_portfolio_simulation_api(
 
     paths = simulate_portfolio_paths(mean_returns, cov_matrix, weights)
 
-    sim_chart_path = plot_simulation_results(paths, regime_name, show=False)
-    corr_chart_path = plot_correlation_heatmap(cov_matrix, regime_name, show=False)
-    risk_chart_path = plot_portfolio_pca_analysis(cov_matrix, regime_name, show=False)
+    # Render the three charts concurrently: each render is mostly C-level drawing
+    # and PNG encoding that releases the GIL, so wall time approaches the slowest
+    # chart instead of the sum of all three.
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        sim_future = executor.submit(
+            plot_simulation_results, paths, regime_name, show=False, cache_key=cache_key
+        )
+        corr_future = executor.submit(
+            plot_correlation_heatmap, cov_matrix, regime_name, show=False, cache_key=cache_key
+        )
+        risk_future = executor.submit(
+            plot_portfolio_pca_analysis, cov_matrix, regime_name, show=False, cache_key=cache_key
+        )
+        sim_chart_path = sim_future.result()
+        corr_chart_path = corr_future.result()
+        risk_chart_path = risk_future.result()
 
     log_info("Charts generated successfully", regime=regime_name, chart_count=3)
 
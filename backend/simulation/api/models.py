@@ -1,3 +1,4 @@
+from typing import Dict
 from pydantic import BaseModel
 
 
@@ -5,3 +6,7 @@ class SimulationChartsResponse(BaseModel):
     simulation_chart_path: str
     correlation_matrix_chart_path: str
     risk_factors_chart_path: str
+
+
+class AllRegimesSimulationResponse(BaseModel):
+    regimes: Dict[str, SimulationChartsResponse]
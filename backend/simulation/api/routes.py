@@ -1,12 +1,51 @@
-from fastapi import APIRouter
+import asyncio
+
+from fastapi import APIRouter, Response
+from fastapi.concurrency import run_in_threadpool
 
 from core.portfolio import get_portfolio
+from core.utils import PRICE_CACHE_TTL_SECONDS
 from simulation.api.api_utils import run_portfolio_simulation_api
-from simulation.api.models import SimulationChartsResponse
+from simulation.api.models import AllRegimesSimulationResponse, SimulationChartsResponse
 from core.api.models import PortfolioRequestPayload
 
 router = APIRouter(prefix="/api/simulate", tags=["simulation"])
 
+DEFAULT_REGIMES = ["historical", "fiat_debasement", "geopolitical_crisis"]
+
+
+@router.post("/all")
+async def simulate_all_default_regimes() -> AllRegimesSimulationResponse:
+    """
+    Run Monte Carlo simulations for the default portfolio under every regime
+    in one request.
+
+    The frontend's "show all regimes" flow otherwise issues three serial
+    requests; here the three simulations run concurrently in the thread pool
+    and share one fetch + mean/covariance computation through the historical
+    stats cache, so the marginal cost per extra regime is the Monte Carlo
+    kernel and its charts.
+
+    Response example:
+    ```json
+    {
+      "regimes": {
+        "historical": {"simulation_chart_path": "...", ...},
+        "fiat_debasement": {"simulation_chart_path": "...", ...},
+        "geopolitical_crisis": {"simulation_chart_path": "...", ...}
+      }
+    }
+    ```
+    """
+    tickers, weights = get_portfolio()
+    results = await asyncio.gather(
+        *[
+            run_in_threadpool(run_portfolio_simulation_api, tickers, weights, regime)
+            for regime in DEFAULT_REGIMES
+        ]
+    )
+    return {"regimes": dict(zip(DEFAULT_REGIMES, results))}
+
 
 @router.post("/custom")
 async def simulate_custom_portfolio_regime(
@@ -35,7 +74,14 @@ async def simulate_custom_portfolio_regime(
     ```
     """
     regime = "custom"
-    return run_portfolio_simulation_api(
+    # Simulation is sync and CPU/IO heavy; run it off the event loop so
+    # concurrent requests are not serialized behind a multi-second simulation.
+    # Threads (not a process pool) are deliberate: the hot paths - BLAS GEMMs,
+    # the batched normal draw, and Agg rendering - release the GIL, while a
+    # worker process would duplicate the in-process price/stats/chart caches
+    # and the numpy+matplotlib footprint per worker on a small container.
+    return await run_in_threadpool(
+        run_portfolio_simulation_api,
         request.tickers,
         request.weights,
         regime,
@@ -45,6 +91,27 @@ async def simulate_custom_portfolio_regime(
     )
 
 
+@router.get("/{regime}")
+async def get_default_portfolio_simulation(
+    regime: str, response: Response
+) -> SimulationChartsResponse:
+    """
+    GET variant of the default-portfolio simulation.
+
+    Inputs are fully derivable from the URL, so unlike the POST route this one
+    is HTTP-cacheable: responses carry a public max-age matching the price
+    cache TTL, letting browsers and any reverse proxy serve repeat "browse
+    regimes" traffic without hitting the simulation pipeline. The response
+    body is identical to POST /api/simulate/{regime}.
+    """
+    tickers, weights = get_portfolio()
+    result = await run_in_threadpool(
+        run_portfolio_simulation_api, tickers, weights, regime
+    )
+    response.headers["Cache-Control"] = f"public, max-age={PRICE_CACHE_TTL_SECONDS}"
+    return result
+
+
 @router.post("/{regime}")
 async def simulate_default_portfolio_regime(regime: str) -> SimulationChartsResponse:
     """
@@ -63,4 +130,4 @@ async def simulate_default_portfolio_regime(regime: str) -> SimulationChartsResp
     ```
     """
     tickers, weights = get_portfolio()
-    return run_portfolio_simulation_api(tickers, weights, regime)
+    return await run_in_threadpool(run_portfolio_simulation_api, tickers, weights, regime)
@@ -1,40 +1,17 @@
 import numpy as np
 import pandas as pd
+from functools import lru_cache
 from typing import List, Dict, Tuple, Optional, Union
 from core.logging_config import log_info, log_error
 
 
-def simulate_daily_returns(
-    mean_returns: np.ndarray,
-    cov_matrix: np.ndarray,
-    weights: np.ndarray,
-    size: int = 252,
-) -> np.ndarray:
-    """
-    Simulate portfolio daily return samples using a multivariate normal distribution.
-
-    Parameters:
-        mean_returns (array-like): Mean daily returns for each asset.
-        cov_matrix (2D array-like): Covariance matrix of asset returns.
-        weights (array-like): Portfolio weights for each asset.
-        size (int): Number of random samples to generate (default: 252).
-
-    Returns:
-        np.ndarray: Array of simulated portfolio daily returns, shape (size,).
-    """
-    samples = np.random.multivariate_normal(mean_returns, cov_matrix, size)
-    portfolio_returns = np.dot(samples, weights)
-
-    return portfolio_returns
-
-
 def simulate_portfolio_paths(
     mean_returns: np.ndarray,
     cov_matrix: np.ndarray,
     weights: np.ndarray,
     initial_value: float = 10000,
     num_simulations: int = 1000,
-) -> List[List[float]]:
+) -> np.ndarray:
     """
     Simulate multiple portfolio value paths over time using Monte Carlo simulation.
 
@@ -46,25 +23,35 @@ def simulate_portfolio_paths(
         num_simulations (int): Number of simulation paths to generate (default: 1000).
 
     Returns:
-        list: List of portfolio value paths, where each path is a list of daily values.
-              Each simulation path starts with initial_value and shows portfolio value
-              evolution over 252 trading days.
+        np.ndarray: Float32 matrix of shape (num_simulations, 253) of portfolio
+                    value paths. Each row starts with initial_value and shows
+                    portfolio value evolution over 252 trading days. Returned
+                    as an ndarray so downstream stats/plotting reuse it without
+                    a list round-trip.
     """
 
-    portfolio_paths = []
-    for _ in range(num_simulations):
-        simulated_daily_returns = simulate_daily_returns(
-            mean_returns, cov_matrix, weights
-        )
+    num_days = 252
 
-        portfolio_path = [initial_value]
-        for day in range(len(simulated_daily_returns)):
-            new_value = portfolio_path[-1] * (1 + simulated_daily_returns[day])
-            portfolio_path.append(new_value)
+    # One vectorized draw for all paths and days, then a single matrix-vector
+    # product and cumulative product - orders of magnitude faster than looping
+    # per path/day in Python, with identical distribution of outcomes. The
+    # heavy steps already run inside BLAS/NumPy C loops, so a JIT compiler
+    # would only add a dependency and cold-start compile latency here.
+    samples = np.random.multivariate_normal(
+        mean_returns, cov_matrix, size=(num_simulations, num_days)
+    )
+    # The (simulations x days x assets) tensor dominates memory traffic here;
+    # float32 halves the bytes through the matmul and cumprod, and the Monte
+    # Carlo sampling error dwarfs the precision given up. The small mean/cov
+    # inputs stay float64 upstream where eigendecompositions need it.
+    samples = samples.astype(np.float32, copy=False)
+    daily_portfolio_returns = samples @ np.asarray(weights, dtype=np.float32)
 
-        portfolio_paths.append(portfolio_path)
+    paths = np.empty((num_simulations, num_days + 1), dtype=np.float32)
+    paths[:, 0] = initial_value
+    paths[:, 1:] = initial_value * np.cumprod(1 + daily_portfolio_returns, axis=1)
 
-    return portfolio_paths
+    return paths
 
 
 def calculate_risk_metrics(portfolio_paths: List[List[float]]) -> Dict[str, float]:
@@ -77,39 +64,31 @@ def calculate_risk_metrics(portfolio_paths: List[List[float]]) -> Dict[str, floa
     Returns:
         dict: Dictionary containing risk metrics with euro amounts and percentages.
     """
-    initial_value = portfolio_paths[0][0]
-    final_values = []
-    losses = []
-    max_drawdowns = []
-
-    # Calculate losses and max drawdown for each path
-    for path in portfolio_paths:
-        final_value = path[-1]
-        final_values.append(final_value)
-
-        # Loss calculation
-        loss = -(final_value / initial_value - 1)
-        losses.append(loss)
-
-        # Max drawdown calculation (peak-to-trough)
-        running_max = np.maximum.accumulate(path)
-        drawdowns = (path - running_max) / running_max
-        max_drawdown = np.min(drawdowns)
-        max_drawdowns.append(max_drawdown)
+    portfolio_paths = np.asarray(portfolio_paths)
+    initial_value = portfolio_paths[0, 0]
+
+    # Losses and max drawdowns for every path at once. The running-max,
+    # drawdown, and reduction steps all run as NumPy C loops over the full
+    # (N, T) matrix, replacing the previous per-path Python loop; a JIT'd
+    # kernel would only save the one cumulative-max temporary.
+    final_values = portfolio_paths[:, -1]
+    losses = -(final_values / initial_value - 1)
+
+    running_max = np.maximum.accumulate(portfolio_paths, axis=1)
+    max_drawdowns = ((portfolio_paths - running_max) / running_max).min(axis=1)
 
     # Worst max drawdown across all paths
-    worst_max_drawdown_pct = min(max_drawdowns) * 100
+    worst_max_drawdown_pct = float(max_drawdowns.min()) * 100
 
-    # Value at Risk at 90% and 99% confidence levels
-    var_90 = np.percentile(losses, 90)
-    var_99 = np.percentile(losses, 99)
+    # Value at Risk at 90% and 99% confidence levels - one shared sort
+    var_90, var_99 = np.percentile(losses, [90, 99])
 
     # Conditional Value at Risk (Expected Shortfall) with empty tail guard
-    tail_90 = [l for l in losses if l >= var_90]
-    tail_99 = [l for l in losses if l >= var_99]
+    tail_90 = losses[losses >= var_90]
+    tail_99 = losses[losses >= var_99]
 
-    cvar_90 = np.mean(tail_90) if tail_90 else var_90
-    cvar_99 = np.mean(tail_99) if tail_99 else var_99
+    cvar_90 = tail_90.mean() if tail_90.size else var_90
+    cvar_99 = tail_99.mean() if tail_99.size else var_99
 
     # Convert to absolute loss amounts
     var_90_abs = var_90 * initial_value
@@ -149,26 +128,29 @@ def calculate_simulation_statistics(
             - final_values: final portfolio values for all paths
             - performance_stats: mean, median, best, worst final values and returns
     """
-    portfolio_paths = np.array(portfolio_paths)
+    # asarray is free when the caller already passes an ndarray, which the
+    # plotting path does after its single up-front conversion.
+    portfolio_paths = np.asarray(portfolio_paths)
 
     # Calculate percentiles across all paths for each time step
     percentiles = np.percentile(portfolio_paths, [5, 10, 25, 50, 75, 90, 95], axis=0)
 
-    # Get final values and find key paths
-    final_values = [path[-1] for path in portfolio_paths]
-    median_final = np.median(final_values)
+    # Get final values and find key paths - one column read shared by all the
+    # stats below instead of per-path Python loops over the full matrix.
+    final_values = portfolio_paths[:, -1]
+    # The 50th-percentile row above already holds the median of the final
+    # column, so no second quickselect over final_values is needed.
+    median_final = percentiles[3, -1]
     best_final = np.max(final_values)
     worst_final = np.min(final_values)
 
     # Find indices of key paths
-    median_path_idx = np.argmin(
-        [abs(path[-1] - median_final) for path in portfolio_paths]
-    )
-    best_path_idx = np.argmax(final_values)
-    worst_path_idx = np.argmin(final_values)
+    median_path_idx = int(np.argmin(np.abs(final_values - median_final)))
+    best_path_idx = int(np.argmax(final_values))
+    worst_path_idx = int(np.argmin(final_values))
 
     # Calculate performance statistics
-    initial_value = portfolio_paths[0][0]
+    initial_value = portfolio_paths[0, 0]
     mean_final = np.mean(final_values)
 
     mean_return_pct = ((mean_final / initial_value) - 1) * 100
@@ -222,34 +204,37 @@ def modify_portfolio_for_regime(
         correlation_move=regime_asset_factors.get("correlation_move_pct", 0),
     )
 
-    modified_mean_returns = mean_returns.copy()
-    modified_cov_matrix = cov_matrix.copy()
-
-    for ticker_i in cov_matrix.columns:
-        if ticker_i not in regime_asset_factors:
-            log_error(
-                "Missing regime factors for ticker",
-                ticker=ticker_i,
-                available_tickers=list(regime_asset_factors.keys()),
-            )
-            return modified_mean_returns, modified_cov_matrix
-        # Modify mean returns
-        # Use loc for position-based assignment to avoid FutureWarning
-        modified_mean_returns.loc[ticker_i] *= regime_asset_factors[ticker_i][
-            "mean_factor"
-        ]
-
-        # --- Covariance Matrix Regime Adjustment ---
-        # - Diagonal elements (i == j): variance is scaled by (vol_factor)^2, so volatility is scaled by vol_factor.
-        # - Off-diagonal elements (i != j): covariance is scaled by both assets' vol_factors, reflecting how joint risk changes.
-        #   This preserves the correlation structure (correlations are unchanged), but increases or decreases the overall risk.
-        for ticker_j in cov_matrix.columns:
-
-            vi = regime_asset_factors[ticker_i]["vol_factor"]
-            vj = regime_asset_factors[ticker_j]["vol_factor"]
-
-            #   modified_cov[ticker_i, ticker_j] = original_cov[i, j] * vol_factor_i * vol_factor_j
-            modified_cov_matrix.loc[ticker_i, ticker_j] *= vi * vj
+    tickers = cov_matrix.columns
+
+    missing_tickers = [t for t in tickers if t not in regime_asset_factors]
+    if missing_tickers:
+        log_error(
+            "Missing regime factors for ticker",
+            ticker=missing_tickers[0],
+            available_tickers=list(regime_asset_factors.keys()),
+        )
+        return mean_returns.copy(), cov_matrix.copy()
+
+    mean_factors = np.array(
+        [regime_asset_factors[t]["mean_factor"] for t in tickers], dtype=np.float64
+    )
+    vol_factors = np.array(
+        [regime_asset_factors[t]["vol_factor"] for t in tickers], dtype=np.float64
+    )
+
+    # Modify mean returns in one vectorized multiply
+    modified_mean_returns = mean_returns * mean_factors
+
+    # --- Covariance Matrix Regime Adjustment ---
+    # - Diagonal elements (i == j): variance is scaled by (vol_factor)^2, so volatility is scaled by vol_factor.
+    # - Off-diagonal elements (i != j): covariance is scaled by both assets' vol_factors, reflecting how joint risk changes.
+    #   This preserves the correlation structure (correlations are unchanged), but increases or decreases the overall risk.
+    # The outer product applies vol_factor_i * vol_factor_j to every cell at once.
+    modified_cov_matrix = pd.DataFrame(
+        cov_matrix.values * np.outer(vol_factors, vol_factors),
+        index=tickers,
+        columns=tickers,
+    )
 
     modified_cov_matrix_analysis = analyze_portfolio_correlation(modified_cov_matrix)
 
@@ -257,18 +242,15 @@ def modify_portfolio_for_regime(
     stdev_outer_product = modified_cov_matrix_analysis["stdev_outer_product"]
 
     # Adjust all off-diagonal correlations by the regime's correlation_move_pct, then rebuild the covariance matrix.
-    for ticker_i in cov_matrix.columns:
-        for ticker_j in cov_matrix.columns:
-            if ticker_i != ticker_j:
-                new_corr = (
-                    corr_matrix.loc[ticker_i, ticker_j]
-                    + corr_matrix.loc[ticker_i, ticker_j]
-                    * regime_asset_factors["correlation_move_pct"]
-                )
-                corr_matrix.loc[ticker_i, ticker_j] = np.clip(new_corr, -1, 1)
-    new_cov = corr_matrix.values * stdev_outer_product
+    corr_values = corr_matrix.to_numpy(copy=True)
+    off_diagonal = ~np.eye(len(tickers), dtype=bool)
+    corr_values[off_diagonal] = np.clip(
+        corr_values[off_diagonal] * (1 + regime_asset_factors["correlation_move_pct"]),
+        -1,
+        1,
+    )
     modified_cov_matrix = pd.DataFrame(
-        new_cov, index=cov_matrix.columns, columns=cov_matrix.columns
+        corr_values * stdev_outer_product, index=tickers, columns=tickers
     )
 
     log_info(
@@ -284,6 +266,19 @@ def modify_portfolio_for_regime(
     return modified_mean_returns, modified_cov_matrix
 
 
+def _cov_cache_key(cov_matrix: pd.DataFrame) -> Tuple[bytes, Tuple[str, ...]]:
+    """Hashable identity of a covariance matrix for the analysis caches."""
+    values = np.ascontiguousarray(cov_matrix.to_numpy(dtype=np.float64))
+    return values.tobytes(), tuple(cov_matrix.columns)
+
+
+def _cov_from_cache_key(cov_bytes: bytes, columns: Tuple[str, ...]) -> pd.DataFrame:
+    """Rebuild the covariance DataFrame from its cache key."""
+    n = len(columns)
+    values = np.frombuffer(cov_bytes, dtype=np.float64).reshape(n, n)
+    return pd.DataFrame(values, index=list(columns), columns=list(columns))
+
+
 def analyze_portfolio_risk_factors(
     cov_matrix: pd.DataFrame,
 ) -> Dict[str, Union[np.ndarray, Dict[int, List[Dict[str, Union[str, float]]]], float]]:
@@ -292,6 +287,11 @@ def analyze_portfolio_risk_factors(
 
     This function computes the eigenvalues and eigenvectors of the covariance matrix, sorts them in descending order of variance explained, and identifies the dominant principal components (PCs) with eigenvalues > 1.0. For each dominant PC, it determines the top contributing assets (by absolute loading percentage), selecting either all assets above a 10% threshold or the top 2 contributors.
 
+    Results are cached on the matrix contents (DataFrames are not hashable, so
+    a bytes key stands in), sparing the eigendecomposition when the same
+    covariance matrix is analyzed repeatedly. Callers must treat the returned
+    dict as read-only.
+
     Parameters:
         cov_matrix (pd.DataFrame): Covariance matrix of asset returns (assets as both rows and columns).
 
@@ -301,6 +301,14 @@ def analyze_portfolio_risk_factors(
             - 'dominant_factor_loadings': dict mapping PC index (1-based) to list of top asset contributors (dicts with 'asset' and 'pct')
             - 'explained_variance_dominant': float, total variance explained by dominant PCs (as a percentage)
     """
+    return _analyze_risk_factors_cached(*_cov_cache_key(cov_matrix))
+
+
+@lru_cache(maxsize=32)
+def _analyze_risk_factors_cached(
+    cov_bytes: bytes, columns: Tuple[str, ...]
+) -> Dict[str, Union[np.ndarray, Dict[int, List[Dict[str, Union[str, float]]]], float]]:
+    cov_matrix = _cov_from_cache_key(cov_bytes, columns)
     eigenvalues, eigenvectors = np.linalg.eigh(cov_matrix.values)
 
     # Scale eigenvalues by 10000 to match the previous percentage-squared scale
@@ -369,12 +377,24 @@ def analyze_portfolio_correlation(
     """
     Compute eigenvalues, condition number, and correlation matrix from a covariance matrix.
 
+    Results are cached on the matrix contents like
+    analyze_portfolio_risk_factors; callers must treat the returned dict as
+    read-only.
+
     Args:
         cov_matrix (pd.DataFrame): Covariance matrix of asset returns.
 
     Returns:
         dict: Condition number, correlation matrix, and stdev outer product.
     """
+    return _analyze_correlation_cached(*_cov_cache_key(cov_matrix))
+
+
+@lru_cache(maxsize=32)
+def _analyze_correlation_cached(
+    cov_bytes: bytes, columns: Tuple[str, ...]
+) -> Dict[str, Union[float, bool, pd.DataFrame, np.ndarray]]:
+    cov_matrix = _cov_from_cache_key(cov_bytes, columns)
     eigenvalues, _ = np.linalg.eigh(cov_matrix.values)
 
     # Conditioning diagnostics
@@ -1,27 +1,57 @@
 import matplotlib
 
-matplotlib.use("Agg")  # Use non-GUI backend before importing pyplot
-import matplotlib.pyplot as plt
+matplotlib.use("Agg")  # Non-GUI backend; charts are rendered to files only
+from matplotlib import style
+from matplotlib.figure import Figure
 import numpy as np
 import pandas as pd
-from typing import List
+from typing import List, Optional
 from simulation.engine.monte_carlo import (
     analyze_portfolio_correlation,
     analyze_portfolio_risk_factors,
     calculate_simulation_statistics,
     calculate_risk_metrics,
 )
-import seaborn as sns
 from core.utils import get_regime_display_suffix, save_figure
 
-plt.style.use("dark_background")
-plt.rcParams["xtick.color"] = "lightgrey"
-plt.rcParams["ytick.color"] = "lightgrey"
-plt.rcParams["axes.edgecolor"] = "grey"
+# Style is applied to the global rcParams once at import; Figure() instances
+# read them at construction. Each plot function below builds its own Figure
+# via the object-oriented API instead of pyplot, so concurrent renders on
+# worker threads never share the implicit current-figure global state.
+style.use("dark_background")
+matplotlib.rcParams["xtick.color"] = "lightgrey"
+matplotlib.rcParams["ytick.color"] = "lightgrey"
+matplotlib.rcParams["axes.edgecolor"] = "grey"
+# Rasterization speed: simplify vector paths aggressively and chunk large
+# paths so Agg renders the percentile bands and path lines faster.
+matplotlib.rcParams["path.simplify"] = True
+matplotlib.rcParams["path.simplify_threshold"] = 1.0
+matplotlib.rcParams["agg.path.chunksize"] = 10000
+
+# Built once at import; format_map fills it per render, so the f-string's
+# per-specifier formatting work isn't redone on every chart.
+_STATS_TEMPLATE = """Portfolio Performance & Risk Metrics:
+
+    Performance:
+    • Median: {median_final:,.0f} ({median_return_pct:+.1f}%)
+    • Mean: {mean_final:,.0f} ({mean_return_pct:+.1f}%)
+    • Best Case: {best_final:,.0f} ({best_return_pct:+.1f}%)
+    • Worst Case: {worst_final:,.0f} ({worst_return_pct:+.1f}%)
+    • Initial: {initial_value:,.0f}
+
+    Risk Metrics:
+    • 90% VaR: {var_90:,.0f} ({var_90_pct:+.1f}%)
+    • 99% VaR: {var_99:,.0f} ({var_99_pct:+.1f}%)
+    • 90% CVaR: {cvar_90:,.0f} ({cvar_90_pct:+.1f}%)
+    • 99% CVaR: {cvar_99:,.0f} ({cvar_99_pct:+.1f}%)
+    • Max Drawdown: {max_drawdown_pct:+.1f}%"""
 
 
 def plot_simulation_results(
-    portfolio_paths: List[List[float]], regime_name: str, show: bool = True
+    portfolio_paths: List[List[float]],
+    regime_name: str,
+    show: bool = True,
+    cache_key: Optional[str] = None,
 ) -> str:
     """Visualizes the results of a Monte Carlo portfolio simulation with percentile bands and key paths.
 
@@ -34,7 +64,8 @@ def plot_simulation_results(
         portfolio_paths (list or np.ndarray): A 2D sequence where each inner sequence
             represents a single simulation path of portfolio values over time.
         regime_name (str, optional): Name of the macroeconomic regime for title and filename.
-        show (bool, optional): Whether to display the plot immediately. Defaults to True.
+        show (bool, optional): Unused on the non-interactive Agg backend; kept for
+            call compatibility.
 
     Features:
         - Three percentile bands showing different confidence intervals
@@ -47,48 +78,63 @@ def plot_simulation_results(
         str: Path to the saved simulation results figure.
     """
 
+    # Convert once; the stats and risk helpers below take the ndarray as-is,
+    # so the path matrix is not re-materialized on every call.
+    portfolio_paths = np.asarray(portfolio_paths)
     stats = calculate_simulation_statistics(portfolio_paths)
 
-    portfolio_paths = np.array(portfolio_paths)
-    plt.figure(figsize=(10, 6))
-    x_values = range(len(portfolio_paths[0]))
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
+    # One ndarray shared by all six draw calls below; a range object would be
+    # re-materialized into an array inside each fill_between/plot call.
+    x_values = np.arange(portfolio_paths.shape[1])
 
     percentiles = stats["percentiles"]
 
+    # Percentile bands are smooth by construction, so cap them at ~500 points:
+    # each fill_between pushes 2x its point count as polygon vertices through
+    # Agg, and beyond screen resolution the extra vertices are invisible. The
+    # median/best/worst lines below keep full resolution. At the default
+    # 252-day horizon the stride is 1 and this is a no-op.
+    stride = max(1, len(x_values) // 500)
+    band_x = x_values[::stride]
+
     # 5th-95th percentile band (90% confidence interval)
-    plt.fill_between(
-        x_values,
-        percentiles[0],
-        percentiles[6],
+    ax.fill_between(
+        band_x,
+        percentiles[0][::stride],
+        percentiles[6][::stride],
         color="lightblue",
         alpha=0.3,
         label="90% Confidence Interval",
     )
 
     # 10th-90th percentile band (80% confidence interval)
-    plt.fill_between(
-        x_values,
-        percentiles[1],
-        percentiles[5],
+    ax.fill_between(
+        band_x,
+        percentiles[1][::stride],
+        percentiles[5][::stride],
         color="skyblue",
         alpha=0.4,
         label="80% Confidence Interval",
     )
 
     # 25th-75th percentile band (50% confidence interval)
-    plt.fill_between(
-        x_values,
-        percentiles[2],
-        percentiles[4],
+    ax.fill_between(
+        band_x,
+        percentiles[2][::stride],
+        percentiles[4][::stride],
         color="steelblue",
         alpha=0.5,
         label="50% Confidence Interval",
     )
 
-    # Plot key paths using pre-calculated indices
+    # Plot key paths using pre-calculated indices. Three individual Line2D
+    # artists are fine here: autoscaling runs once at draw time regardless,
+    # and a LineCollection would need legend proxy artists for no gain.
     path_indices = stats["path_indices"]
 
-    plt.plot(
+    ax.plot(
         x_values,
         portfolio_paths[path_indices["median"]],
         color="#AED6F1",
@@ -96,7 +142,7 @@ def plot_simulation_results(
         label="Median Path",
         zorder=5,
     )
-    plt.plot(
+    ax.plot(
         x_values,
         portfolio_paths[path_indices["best"]],
         color="#5A9D15",
@@ -104,7 +150,7 @@ def plot_simulation_results(
         label="Best Case",
         zorder=4,
     )
-    plt.plot(
+    ax.plot(
         x_values,
         portfolio_paths[path_indices["worst"]],
         color="#9D2228",
@@ -117,27 +163,13 @@ def plot_simulation_results(
 
     risk_metrics = calculate_risk_metrics(portfolio_paths)
 
-    stats_text = f"""Portfolio Performance & Risk Metrics:
-    
-    Performance:
-    • Median: {perf_stats['median_final']:,.0f} ({perf_stats['median_return_pct']:+.1f}%)
-    • Mean: {perf_stats['mean_final']:,.0f} ({perf_stats['mean_return_pct']:+.1f}%)
-    • Best Case: {perf_stats['best_final']:,.0f} ({perf_stats['best_return_pct']:+.1f}%)
-    • Worst Case: {perf_stats['worst_final']:,.0f} ({perf_stats['worst_return_pct']:+.1f}%)
-    • Initial: {perf_stats['initial_value']:,.0f}
-
-    Risk Metrics:
-    • 90% VaR: {risk_metrics['var_90']:,.0f} ({risk_metrics['var_90_pct']:+.1f}%)
-    • 99% VaR: {risk_metrics['var_99']:,.0f} ({risk_metrics['var_99_pct']:+.1f}%)
-    • 90% CVaR: {risk_metrics['cvar_90']:,.0f} ({risk_metrics['cvar_90_pct']:+.1f}%)
-    • 99% CVaR: {risk_metrics['cvar_99']:,.0f} ({risk_metrics['cvar_99_pct']:+.1f}%)
-    • Max Drawdown: {risk_metrics['max_drawdown_pct']:+.1f}%"""
+    stats_text = _STATS_TEMPLATE.format_map({**perf_stats, **risk_metrics})
 
-    plt.text(
+    ax.text(
         0.02,
         0.98,
         stats_text,
-        transform=plt.gca().transAxes,
+        transform=ax.transAxes,
         verticalalignment="top",
         fontsize=10,
         bbox=dict(
@@ -148,39 +180,37 @@ def plot_simulation_results(
         ),
     )
 
-    plt.title(
+    ax.set_title(
         f"Monte Carlo Portfolio Simulation: \n{len(portfolio_paths)} Scenarios Over {x_values[-1]} Trading Days"
         + get_regime_display_suffix(regime_name),
         fontsize=14,
         fontweight="bold",
         pad=20,
     )
-    plt.xlabel("Trading Days", fontsize=12, color="lightgrey")
-    plt.ylabel("Portfolio Value", fontsize=12, color="lightgrey")
-    plt.grid(True, alpha=0.3)
-    plt.legend(
+    ax.set_xlabel("Trading Days", fontsize=12, color="lightgrey")
+    ax.set_ylabel("Portfolio Value", fontsize=12, color="lightgrey")
+    ax.grid(True, alpha=0.3)
+    ax.legend(
         facecolor="#262626", edgecolor="#666666", framealpha=0.9, loc="upper center"
     )
-    plt.margins(x=0)  # Remove horizontal padding to fit the data snugly
+    ax.margins(x=0)  # Remove horizontal padding to fit the data snugly
 
-    plt.tight_layout()
+    fig.tight_layout()
 
-    url_path = save_figure(regime_name, "monte_carlo_simulation")
-    if not show:
-        plt.close()  # Prevent memory leaks by closing the figure
-    else:
-        plt.show()
-    return url_path
+    return save_figure(fig, regime_name, "monte_carlo_simulation", cache_key)
 
 
 def plot_correlation_heatmap(
-    cov_matrix: pd.DataFrame, regime_name: str, show: bool = True
+    cov_matrix: pd.DataFrame,
+    regime_name: str,
+    show: bool = True,
+    cache_key: Optional[str] = None,
 ) -> str:
     """
-    Plot a heatmap of the portfolio's correlation matrix using seaborn, with conditioning diagnostics.
+    Plot a heatmap of the portfolio's correlation matrix, with conditioning diagnostics.
 
     Parameters:
-        show (bool, optional): Whether to display the plot immediately. Defaults to True.
+        show (bool, optional): Unused on the non-interactive Agg backend; kept for call compatibility.
         cov_matrix (pd.DataFrame): Covariance matrix of asset returns (assets as both rows and columns).
         regime_name (str): Scenario name (e.g., 'historical', 'fiat_debasement', 'geopolitical_crisis') for plot title and file naming.
 
@@ -207,24 +237,57 @@ def plot_correlation_heatmap(
         cond_status = "Poorly Conditioned"
         cond_color = "#9D2228"
 
-    plt.figure(figsize=(8, 6))
-    sns.heatmap(
-        corr_matrix,
-        annot=True,
-        fmt=".2f",
+    fig = Figure(figsize=(8, 6))
+    ax = fig.subplots()
+
+    # Draw the raster directly with pcolormesh instead of seaborn's heatmap
+    # wrapper, which layers pandas-indexed tick/annotation/cbar machinery on
+    # top of the same mesh. Rendering is identical; the wrapper overhead and
+    # the seaborn import cost at startup are gone.
+    values = corr_matrix.to_numpy()
+    n = len(corr_matrix)
+    mesh = ax.pcolormesh(
+        values,
         cmap="coolwarm",
         alpha=0.8,
         vmin=-1,
         vmax=1,
-        square=True,
-        cbar_kws={"shrink": 0.8},
-        linewidths=0.5,
-        linecolor="grey",
+        edgecolors="grey",
+        linewidth=0.5,
     )
-    plt.xticks(rotation=45, ha="right")
-    plt.yticks(rotation=0)
-
-    plt.title(
+    ax.set_aspect("equal")
+    ax.invert_yaxis()  # Row 0 on top, matching conventional matrix layout
+    fig.colorbar(mesh, ax=ax, shrink=0.8)
+
+    cell_centers = np.arange(n) + 0.5
+    ax.set_xticks(cell_centers)
+    ax.set_xticklabels(corr_matrix.columns, rotation=45, ha="right")
+    ax.set_yticks(cell_centers)
+    ax.set_yticklabels(corr_matrix.index, rotation=0)
+    ax.tick_params(length=0)
+
+    # Per-cell annotations cost one Text artist per cell (n^2); beyond ~20
+    # assets they are unreadable anyway, so let the colormap carry the values
+    # for large custom portfolios. Text color flips with cell luminance so
+    # annotations stay legible at both colormap extremes.
+    if n <= 20:
+        cmap = mesh.get_cmap()
+        for i in range(n):
+            for j in range(n):
+                value = values[i, j]
+                r, g, b, _ = cmap((value + 1) / 2)
+                luminance = 0.299 * r + 0.587 * g + 0.114 * b
+                ax.text(
+                    j + 0.5,
+                    i + 0.5,
+                    f"{value:.2f}",
+                    ha="center",
+                    va="center",
+                    fontsize=9,
+                    color="black" if luminance > 0.408 else "white",
+                )
+
+    ax.set_title(
         f"Portfolio Correlation Matrix" + get_regime_display_suffix(regime_name),
         fontsize=14,
         fontweight="bold",
@@ -237,7 +300,7 @@ def plot_correlation_heatmap(
         else ("∞" if not np.isfinite(condition_number) else f"{condition_number:.1f}")
     )
 
-    plt.text(
+    ax.text(
         0.5,
         1.005,
         f"Condition Number: {display_condition} • {cond_status}",
@@ -245,18 +308,18 @@ def plot_correlation_heatmap(
         color=cond_color,
         ha="center",
         va="bottom",
-        transform=plt.gca().transAxes,
+        transform=ax.transAxes,
         fontweight="bold",
     )
 
-    url_path = save_figure(regime_name, "correlation_matrix")
-    if show:
-        plt.show()
-    return url_path
+    return save_figure(fig, regime_name, "correlation_matrix", cache_key)
 
 
 def plot_portfolio_pca_analysis(
-    cov_matrix: pd.DataFrame, regime_name: str, show: bool = True
+    cov_matrix: pd.DataFrame,
+    regime_name: str,
+    show: bool = True,
+    cache_key: Optional[str] = None,
 ) -> str:
     """
     Visualize principal component analysis (PCA) results for a portfolio as a risk factor bar chart.
@@ -264,7 +327,7 @@ def plot_portfolio_pca_analysis(
     This function plots the eigenvalues of the portfolio's covariance (or correlation) matrix as a bar chart, highlighting dominant risk factors (principal components with eigenvalue > 1.0) in a distinct color. For each dominant factor, it annotates the bar with the top contributing assets (those with >10% loading or at least the top 2), stacking their names and percentage contributions proportionally within the bar. An information panel summarizes the number of dominant factors, total explained variance, and other key statistics.
 
     Parameters:
-        show (bool, optional): Whether to display the plot immediately. Defaults to True.
+        show (bool, optional): Unused on the non-interactive Agg backend; kept for call compatibility.
         corr_matrix_analysis (dict): Output of analyze_portfolio_risk_factors(), containing:
             - 'eigenvalues': array-like, eigenvalues of the matrix
             - 'dominant_factor_loadings' (or 'dominant_factor_loadings'): dict mapping PC index to list of top asset contributors
@@ -289,25 +352,26 @@ def plot_portfolio_pca_analysis(
     MINOR_COLOR = "#6fa8dc"
     colors = [DOMINANT_COLOR if val > 1.0 else MINOR_COLOR for val in eigenvalues]
 
-    plt.figure(figsize=(8, 6))
+    fig = Figure(figsize=(8, 6))
+    ax = fig.subplots()
 
     # Draw a horizontal line at y=1.0 to indicate the dominance threshold
-    plt.axhline(y=1.0, color="gray", linestyle="--", alpha=0.7, linewidth=1)
+    ax.axhline(y=1.0, color="gray", linestyle="--", alpha=0.7, linewidth=1)
 
-    plt.xlabel("Principal Component", fontsize=12)
-    plt.ylabel("Eigenvalue (λ)", fontsize=12)
-    plt.title(
+    ax.set_xlabel("Principal Component", fontsize=12)
+    ax.set_ylabel("Eigenvalue (λ)", fontsize=12)
+    ax.set_title(
         f"Portfolio Risk Factor Analysis" + get_regime_display_suffix(regime_name),
         fontsize=14,
         fontweight="bold",
         pad=20,
     )
 
-    plt.xticks(range(1, len(eigenvalues) + 1))
-    plt.grid(axis="y", alpha=0.3)
+    ax.set_xticks(range(1, len(eigenvalues) + 1))
+    ax.grid(axis="y", alpha=0.3)
 
     # Set y-axis to start at 0 for better visual proportion
-    plt.ylim(0, max(eigenvalues) * 1.1)
+    ax.set_ylim(0, max(eigenvalues) * 1.1)
 
     info_panel_text = (
         f"Risk Factor Summary:\n"
@@ -317,11 +381,11 @@ def plot_portfolio_pca_analysis(
         f"• Total Components: {len(eigenvalues)}"
     )
 
-    plt.gca().text(
+    ax.text(
         0.5,
         0.98,
         info_panel_text,
-        transform=plt.gca().transAxes,
+        transform=ax.transAxes,
         verticalalignment="top",
         horizontalalignment="left",
         fontsize=10,
@@ -333,7 +397,7 @@ def plot_portfolio_pca_analysis(
         ),
     )
 
-    bars = plt.bar(
+    bars = ax.bar(
         range(1, len(eigenvalues) + 1),
         eigenvalues,
         color=colors,
@@ -342,16 +406,21 @@ def plot_portfolio_pca_analysis(
         linewidth=0.5,
     )
 
-    # Annotate each dominant PC bar with its top contributing assets
+    # Annotate each dominant PC bar with its top contributing assets. Label
+    # centers come from one cumsum over the stacked segment heights instead of
+    # accumulating per asset in Python.
     for pc_number, pc_assets in dominant_factor_loadings.items():
         bar = bars[pc_number - 1]
-        y_start = 0
+        x_center = bar.get_x() + bar.get_width() / 2
+
+        asset_heights = eigenvalues[pc_number - 1] * (
+            np.fromiter((asset["pct"] for asset in pc_assets), dtype=np.float64) / 100
+        )
+        y_centers = np.cumsum(asset_heights) - asset_heights / 2
 
-        for asset in pc_assets:
-            asset_height = eigenvalues[pc_number - 1] * (asset["pct"] / 100)
-            y_pos = y_start + asset_height / 2
-            plt.text(
-                bar.get_x() + bar.get_width() / 2,
+        for asset, y_pos in zip(pc_assets, y_centers):
+            ax.text(
+                x_center,
                 y_pos,
                 f"{asset['asset']} {asset['pct']:.0f}%",
                 ha="center",
@@ -365,10 +434,6 @@ def plot_portfolio_pca_analysis(
                     edgecolor="#666666",
                 ),
             )
-            y_start += asset_height  # Stack asset labels within the bar
 
-    plt.tight_layout()
-    url_path = save_figure(regime_name, "risk_factor_analysis")
-    if show:
-        plt.show()
-    return url_path
+    fig.tight_layout()
+    return save_figure(fig, regime_name, "risk_factor_analysis", cache_key)
@@ -93,7 +93,10 @@ class TestRunPortfolioSimulationApi:
             # This will fail for all except "Historical" due to mocking requirements,
             # but tests the normalization logic
             if expected_normalized == "historical":
-                with patch("core.api.api_utils.get_cached_prices"), patch(
+                with patch(
+                    "core.api.api_utils.get_cached_prices",
+                    return_value=pd.DataFrame({"BTC-EUR": [100, 102, 101]}),
+                ), patch(
                     "simulation.api.api_utils.simulate_portfolio_paths"
                 ), patch("simulation.api.api_utils.plot_simulation_results"), patch(
                     "simulation.api.api_utils.plot_correlation_heatmap"
@@ -181,9 +184,9 @@ class TestValidatePortfolio:
         start_date = "2023-01-01"
         end_date = "2023-12-31"
 
-        with patch("core.api.api_utils.get_cached_prices") as mock_fetch:
-            # Mock successful data fetching
-            mock_fetch.return_value = pd.DataFrame()
+        with patch("core.api.api_utils.verify_tickers_exist") as mock_verify:
+            # Mock successful ticker probe
+            mock_verify.return_value = None
 
             result = validate_portfolio(
                 tickers, weights, regime_factors, start_date, end_date
@@ -276,8 +279,8 @@ class TestValidatePortfolio:
         assert "Vol factor must be positive" in errors
         assert "between -0.99 and 0.99" in errors
 
-    @patch("core.api.api_utils.get_cached_prices")
-    def test_invalid_tickers_fail_validation(self, mock_fetch):
+    @patch("core.api.api_utils.verify_tickers_exist")
+    def test_invalid_tickers_fail_validation(self, mock_verify):
         """Test that invalid tickers fail validation."""
 
         tickers = ["INVALID_TICKER"]
@@ -286,8 +289,8 @@ class TestValidatePortfolio:
         start_date = "2023-01-01"
         end_date = "2023-12-31"
 
-        # Mock fetch failure
-        mock_fetch.side_effect = InvalidTickersException(
+        # Mock probe failure
+        mock_verify.side_effect = InvalidTickersException(
             "Invalid ticker: INVALID_TICKER"
         )
 
@@ -349,6 +352,42 @@ class TestFastApiIntegration:
         assert "simulation_chart_path" in data
         mock_simulation.assert_called_once()
 
+    @patch("simulation.api.routes.run_portfolio_simulation_api")
+    def test_default_portfolio_simulation_get_endpoint(self, mock_simulation):
+        """Test cacheable GET /api/simulate/{regime} variant."""
+        mock_simulation.return_value = {
+            "simulation_chart_path": "/charts/historical/monte_carlo_simulation_historical.png",
+            "correlation_matrix_chart_path": "/charts/historical/correlation_matrix_historical.png",
+            "risk_factors_chart_path": "/charts/historical/risk_factor_analysis_historical.png",
+        }
+
+        response = self.client.get("/api/simulate/historical")
+
+        assert response.status_code == 200
+        assert "public, max-age=" in response.headers["cache-control"]
+        assert "simulation_chart_path" in response.json()
+        mock_simulation.assert_called_once()
+
+    @patch("simulation.api.routes.run_portfolio_simulation_api")
+    def test_all_regimes_simulation_endpoint(self, mock_simulation):
+        """Test /api/simulate/all endpoint runs every default regime."""
+        mock_simulation.return_value = {
+            "simulation_chart_path": "/charts/historical/monte_carlo_simulation_historical.png",
+            "correlation_matrix_chart_path": "/charts/historical/correlation_matrix_historical.png",
+            "risk_factors_chart_path": "/charts/historical/risk_factor_analysis_historical.png",
+        }
+
+        response = self.client.post("/api/simulate/all")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert set(data["regimes"]) == {
+            "historical",
+            "fiat_debasement",
+            "geopolitical_crisis",
+        }
+        assert mock_simulation.call_count == 3
+
     @patch("core.api.routes.validate_portfolio")
     def test_portfolio_validation_endpoint(self, mock_validate):
         """Test /api/portfolio/validate endpoint."""
@@ -463,14 +502,13 @@ class TestDualAccessPatterns:
 class TestCachedPricesFunctionality:
     """Test the caching functionality for price data fetching."""
 
-    def test_cache_preserves_ticker_order(self):
-        """Test that different ticker orders create separate cache entries."""
-        from core.utils import get_cached_prices
-        import time
+    def test_cache_key_is_order_insensitive(self):
+        """Test that different ticker orders share one cache entry but keep column order."""
+        from core.utils import _fetch_close_prices_cached, get_cached_prices
 
         # Clear cache before test
-        get_cached_prices.cache_clear()
-        
+        _fetch_close_prices_cached.cache_clear()
+
         # Test different ticker orders
         tickers1 = 'BTC-EUR,AAPL'
         tickers2 = 'AAPL,BTC-EUR'
@@ -479,36 +517,41 @@ class TestCachedPricesFunctionality:
         with patch("core.utils.fetch_close_prices") as mock_fetch:
             # Mock return value
             mock_fetch.return_value = pd.DataFrame({
-                'BTC-EUR': [100, 101, 102],
-                'AAPL': [150, 151, 152]
+                'AAPL': [150, 151, 152],
+                'BTC-EUR': [100, 101, 102]
             })
 
             # First call - cache miss
             result1 = get_cached_prices(tickers1, start, end)
-            
-            # Second call with different order - should be cache miss
+
+            # Second call with different order - should hit the same entry
             result2 = get_cached_prices(tickers2, start, end)
-            
-            # Third call with original order - should be cache hit
+
+            # Third call with original order - should be a cache hit too
             result3 = get_cached_prices(tickers1, start, end)
 
             # Verify cache behavior
-            cache_info = get_cached_prices.cache_info()
-            assert cache_info.hits == 1  # Only the third call was a hit
-            assert cache_info.misses == 2  # First two calls were misses
-            assert cache_info.currsize == 2  # Two entries in cache
+            cache_info = _fetch_close_prices_cached.cache_info()
+            assert cache_info.hits == 2  # Second and third calls were hits
+            assert cache_info.misses == 1  # Only the first call was a miss
+            assert cache_info.currsize == 1  # One shared entry in cache
+
+            # Verify fetch_close_prices was only called once
+            assert mock_fetch.call_count == 1
 
-            # Verify fetch_close_prices was called twice (not three times)
-            assert mock_fetch.call_count == 2
+            # Columns follow the requested order, not the cache-key order
+            assert list(result1.columns) == ['BTC-EUR', 'AAPL']
+            assert list(result2.columns) == ['AAPL', 'BTC-EUR']
+            assert list(result3.columns) == ['BTC-EUR', 'AAPL']
 
     def test_cache_performance_improvement(self):
         """Test that caching provides performance improvement."""
-        from core.utils import get_cached_prices
+        from core.utils import _fetch_close_prices_cached, get_cached_prices
         import time
 
         # Clear cache before test
-        get_cached_prices.cache_clear()
-        
+        _fetch_close_prices_cached.cache_clear()
+
         tickers = 'BTC-EUR'
         start, end = '2023-01-01', '2023-02-01'
 
@@ -539,10 +582,10 @@ class TestCachedPricesFunctionality:
 
     def test_cache_string_conversion_logic(self):
         """Test that ticker string conversion works correctly."""
-        from core.utils import get_cached_prices
+        from core.utils import _fetch_close_prices_cached, get_cached_prices
 
         # Clear cache before test
-        get_cached_prices.cache_clear()
+        _fetch_close_prices_cached.cache_clear()
 
         with patch("core.utils.fetch_close_prices") as mock_fetch:
             mock_fetch.return_value = pd.DataFrame({
@@ -555,10 +598,13 @@ class TestCachedPricesFunctionality:
             tickers_str = 'BTC-EUR,AAPL,MSFT'
             result = get_cached_prices(tickers_str, '2023-01-01', '2023-02-01')
 
-            # Verify that fetch_close_prices was called with correct list
-            expected_tickers = ['BTC-EUR', 'AAPL', 'MSFT']
+            # Verify that fetch_close_prices was called with the sorted, deduplicated list
+            expected_tickers = ['AAPL', 'BTC-EUR', 'MSFT']
             mock_fetch.assert_called_once()
             args, kwargs = mock_fetch.call_args
             assert args[0] == expected_tickers
             assert args[1] == '2023-01-01'
             assert args[2] == '2023-02-01'
+
+            # Result columns follow the requested order
+            assert list(result.columns) == ['BTC-EUR', 'AAPL', 'MSFT']
@@ -25,8 +25,11 @@ const LivePriceWidget: FC<Props> = ({ portfolioAssets }) => {
   const wsUrl =
     API_BASE_URL.replace(/^https:/, "wss:").replace(/^http:/, "ws:") +
     "/api/ws/live-prices";
-  const { lastJsonMessage, sendJsonMessage, readyState } =
-    useWebSocket<StockQuote | null>(wsUrl, { shouldReconnect: () => true });
+  // The backend coalesces quote bursts into arrays; older single-object
+  // frames are still handled for compatibility.
+  const { lastJsonMessage, sendJsonMessage, readyState } = useWebSocket<
+    StockQuote | StockQuote[] | null
+  >(wsUrl, { shouldReconnect: () => true });
 
   useEffect(() => {
     if (readyState !== 1) return;
@@ -38,18 +41,30 @@ const LivePriceWidget: FC<Props> = ({ portfolioAssets }) => {
   }, [portfolioAssets, sendJsonMessage, readyState]);
 
   useEffect(() => {
-    if (!lastJsonMessage?.id || !lastJsonMessage.market_hours) return;
-
-    setLivePrices((prev) => ({
-      ...prev,
-      [lastJsonMessage.id]: {
-        change_percent: lastJsonMessage.change_percent ?? 0,
-        market_hours: lastJsonMessage.market_hours ?? 0,
-      },
-    }));
+    if (!lastJsonMessage) return;
+
+    const quotes = (
+      Array.isArray(lastJsonMessage) ? lastJsonMessage : [lastJsonMessage]
+    ).filter((quote) => quote?.id && quote.market_hours);
+    if (!quotes.length) return;
+
+    setLivePrices((prev) => {
+      const next = { ...prev };
+      for (const quote of quotes) {
+        next[quote.id] = {
+          change_percent: quote.change_percent ?? 0,
+          market_hours: quote.market_hours ?? 0,
+        };
+      }
+      return next;
+    });
 
     setLastUpdated((prev) =>
-      !prev || lastJsonMessage.time > prev ? lastJsonMessage.time : prev
+      quotes.reduce(
+        (latest, quote) =>
+          !latest || quote.time > latest ? quote.time : latest,
+        prev
+      )
     );
   }, [lastJsonMessage]);
 